@@ -8,13 +8,7 @@ import argparse
 import json
 import logging
 import sys
-from pathlib import Path
-from datetime import datetime, timedelta
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from baltic_exchange_scraper import BalticExchangeScraper
+import time
 
 # Set up logging
 logging.basicConfig(
@@ -27,12 +21,13 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def main():
-    """Main function to run the Baltic Exchange scraper."""
-    parser = argparse.ArgumentParser(
-        description="Baltic Exchange Weekly Market Roundup Scraper",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
+_VESSEL_TYPES = ('capesize', 'panamax', 'supramax', 'handysize')
+
+# Command-line parser, built once at import time
+_PARSER = argparse.ArgumentParser(
+    description="Baltic Exchange Weekly Market Roundup Scraper",
+    formatter_class=argparse.RawDescriptionHelpFormatter,
+    epilog="""
 Examples:
   # Run scraper with default settings
   python run_baltic_scraper.py
@@ -43,223 +38,298 @@ Examples:
   # Export data to CSV
   python run_baltic_scraper.py --export-csv
   
+  # Export data to newline-delimited JSON
+  python run_baltic_scraper.py --export-ndjson
+  
   # Get statistics only
   python run_baltic_scraper.py --stats-only
   
   # Test connection
   python run_baltic_scraper.py --test-connection
-        """
-    )
+    """
+)
+
+_PARSER.add_argument(
+    '--data-dir',
+    default='data',
+    help='Directory to store data files (default: data)'
+)
+
+_PARSER.add_argument(
+    '--force',
+    action='store_true',
+    help='Force update even if data is recent'
+)
+
+_PARSER.add_argument(
+    '--export-csv',
+    action='store_true',
+    help='Export data to CSV format'
+)
+
+_PARSER.add_argument(
+    '--csv-file',
+    default=None,
+    help='Output CSV file path (default: market_data_YYYY-MM-DD.csv)'
+)
+
+_PARSER.add_argument(
+    '--export-ndjson',
+    action='store_true',
+    help='Export data to newline-delimited JSON format'
+)
+
+_PARSER.add_argument(
+    '--ndjson-file',
+    default=None,
+    help='Output NDJSON file path (default: market_data_YYYY-MM-DD.ndjson)'
+)
+
+_PARSER.add_argument(
+    '--stats-only',
+    action='store_true',
+    help='Show statistics only, do not update data'
+)
+
+_PARSER.add_argument(
+    '--test-connection',
+    action='store_true',
+    help='Test connection to Baltic Exchange website'
+)
+
+_PARSER.add_argument(
+    '--trend-days',
+    type=int,
+    default=30,
+    help='Number of days for trend analysis (default: 30)'
+)
+
+_PARSER.add_argument(
+    '--verbose',
+    action='store_true',
+    help='Enable verbose logging'
+)
+
+def _test_connection(scraper, args):
+    """Test the connection to Baltic Exchange and print the result."""
+    logger.info("Testing connection to Baltic Exchange...")
+    result = scraper.test_connection()
+    lines = []
+    w = lines.append
+    w("\n" + "="*50)
+    w("CONNECTION TEST RESULTS")
+    w("="*50)
+    w(f"Status: {result['status']}")
+    w(f"Message: {result['message']}")
+    w(f"Response Time: {result['response_time_seconds']}s")
+    w(f"Endpoint: {result['api_endpoint']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _show_statistics(scraper, args):
+    """Print market data statistics and the BDI trend."""
+    logger.info("Getting statistics...")
+    stats = scraper.get_statistics()
+    # Collect the report and write it in one go
+    lines = []
+    w = lines.append
+    w("\n" + "="*50)
+    w("MARKET DATA STATISTICS")
+    w("="*50)
+    w(f"Total Entries: {stats['total_entries']}")
+    w(f"Last Update: {stats['last_update']}")
+    w(f"Update Count: {stats['update_count']}")
+    
+    if stats['bdi_summary']['current']:
+        w(f"\nBDI Summary:")
+        w(f"  Current: {stats['bdi_summary']['current']}")
+        w(f"  Min: {stats['bdi_summary']['min']}")
+        w(f"  Max: {stats['bdi_summary']['max']}")
+        w(f"  Average: {stats['bdi_summary']['average']:.2f}")
     
-    parser.add_argument(
-        '--data-dir',
-        default='data',
-        help='Directory to store data files (default: data)'
-    )
+    if stats['p5_summary']['current']:
+        w(f"\nP5 Summary:")
+        w(f"  Current: {stats['p5_summary']['current']}")
+        w(f"  Min: {stats['p5_summary']['min']}")
+        w(f"  Max: {stats['p5_summary']['max']}")
+        w(f"  Average: {stats['p5_summary']['average']:.2f}")
     
-    parser.add_argument(
-        '--force',
-        action='store_true',
-        help='Force update even if data is recent'
-    )
+    # Show BDI trend
+    trend = scraper.get_bdi_trend(days=args.trend_days)
+    if trend['trend'] != 'insufficient_data':
+        w(f"\nBDI Trend ({args.trend_days} days):")
+        w(f"  Direction: {trend['trend'].upper()}")
+        w(f"  Change: {trend['change']} ({trend['change_percentage']}%)")
+        w(f"  Start: {trend['start_value']} → End: {trend['end_value']}")
+        w(f"  Data Points: {trend['data_points']}")
+    else:
+        w(f"\nBDI Trend: Insufficient data for {args.trend_days} days")
     
-    parser.add_argument(
-        '--export-csv',
-        action='store_true',
-        help='Export data to CSV format'
-    )
+    sys.stdout.write("\n".join(lines) + "\n")
+
+def _update_data(scraper, args):
+    """Update market data and print the results and latest entry."""
+    logger.info("Starting market data update...")
+    result = scraper.update_market_data(force_update=args.force)
+    
+    # Display results, collecting each section and writing it in one go
+    lines = []
+    w = lines.append
+    w("\n" + "="*50)
+    w("UPDATE RESULTS")
+    w("="*50)
+    w(f"Status: {result['status']}")
+    w(f"Message: {result['message']}")
+    
+    if result['status'] == 'success':
+        w(f"New Entries: {result['new_entries']}")
+        w(f"Total Entries: {result['total_entries']}")
+        w(f"Duration: {result['duration_seconds']}s")
+        w(f"Last Update: {result['last_update']}")
+        
+        if result.get('bdi_value'):
+            w(f"BDI Value: {result['bdi_value']}")
+        if result.get('p5_value'):
+            w(f"P5 Value: {result['p5_value']}")
+    
+    elif result['status'] == 'skipped':
+        w(f"Last Update: {result['last_update']}")
+        w(f"Total Entries: {result['total_entries']}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+    
+    # Show latest data
+    latest_data = scraper.get_latest_data()
+    if latest_data:
+        lines = []
+        w = lines.append
+        w(f"\n" + "="*50)
+        w("LATEST MARKET DATA")
+        w("="*50)
+        w(f"Scraped At: {latest_data.get('scraped_at', 'N/A')}")
+        
+        bdi = latest_data.get('bdi', {})
+        if bdi.get('current_value'):
+            w(f"BDI: {bdi['current_value']}")
+            if bdi.get('change'):
+                change_str = f"{bdi['change']:+}"
+                if bdi.get('change_percentage'):
+                    change_str += f" ({bdi['change_percentage']:+.2f}%)"
+                w(f"BDI Change: {change_str}")
+        
+        p5 = latest_data.get('p5', {})
+        if p5.get('summary', {}).get('value'):
+            w(f"P5: {p5['summary']['value']}")
+        
+        bulk_rates = latest_data.get('bulk_rates', {})
+        present_rates = [
+            (vessel_type, rate) for vessel_type in _VESSEL_TYPES
+            if (rate := bulk_rates.get(vessel_type, {}).get('rate'))
+        ]
+        if present_rates:
+            w("Bulk Rates:")
+            for vessel_type, rate in present_rates:
+                w(f"  {vessel_type.title()}: {rate}")
+        
+        market_summary = latest_data.get('market_summary', {})
+        if market_summary.get('market_sentiment'):
+            w(f"Market Sentiment: {market_summary['market_sentiment']}")
+        
+        sys.stdout.write("\n".join(lines) + "\n")
+
+def _export_csv(scraper, args):
+    """Export market data to a CSV file."""
+    logger.info("Exporting data to CSV...")
     
-    parser.add_argument(
-        '--csv-file',
-        default=None,
-        help='Output CSV file path (default: market_data_YYYY-MM-DD.csv)'
-    )
+    # Determine output file
+    if args.csv_file:
+        csv_file = args.csv_file
+    else:
+        timestamp = time.strftime("%Y-%m-%d")
+        csv_file = f"market_data_{timestamp}.csv"
     
-    parser.add_argument(
-        '--stats-only',
-        action='store_true',
-        help='Show statistics only, do not update data'
-    )
+    # Stream rows straight to the CSV file
+    data_rows = scraper.export_csv_to(csv_file)
     
-    parser.add_argument(
-        '--test-connection',
-        action='store_true',
-        help='Test connection to Baltic Exchange website'
-    )
+    if data_rows:
+        sys.stdout.write(f"\nData exported to: {csv_file}\nCSV contains {data_rows} data rows\n")
+    else:
+        print("\nNo data available for CSV export")
+
+def _export_ndjson(scraper, args):
+    """Export market data to an NDJSON file."""
+    logger.info("Exporting data to NDJSON...")
     
-    parser.add_argument(
-        '--trend-days',
-        type=int,
-        default=30,
-        help='Number of days for trend analysis (default: 30)'
-    )
+    # Determine output file
+    if args.ndjson_file:
+        ndjson_file = args.ndjson_file
+    else:
+        timestamp = time.strftime("%Y-%m-%d")
+        ndjson_file = f"market_data_{timestamp}.ndjson"
     
-    parser.add_argument(
-        '--verbose',
-        action='store_true',
-        help='Enable verbose logging'
-    )
+    entries_written = scraper.export_ndjson(ndjson_file)
     
-    args = parser.parse_args()
+    if entries_written:
+        sys.stdout.write(f"\nData exported to: {ndjson_file}\nNDJSON contains {entries_written} entries\n")
+    else:
+        print("\nNo data available for NDJSON export")
+
+def _show_summary(scraper, args):
+    """Print summary statistics."""
+    stats = scraper.get_statistics()
+    lines = []
+    w = lines.append
+    w(f"\n" + "="*50)
+    w("SUMMARY")
+    w("="*50)
+    w(f"Total Data Entries: {stats['total_entries']}")
+    w(f"Weekly Reports Summary:")
+    if stats['total_entries']:
+        w(f"  Total Weekly Reports: {scraper.count_weekly_reports()}")
+        w(f"  Data Entries: {stats['total_entries']}")
+    else:
+        w(f"  No data available")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
+
+# Actions that run on their own and end the command
+_EXCLUSIVE_ACTIONS = (
+    ('test_connection', _test_connection),
+    ('stats_only', _show_statistics),
+)
+
+# Update pipeline, run in order; a None flag means the step always runs
+_UPDATE_ACTIONS = (
+    (None, _update_data),
+    ('export_csv', _export_csv),
+    ('export_ndjson', _export_ndjson),
+    (None, _show_summary),
+)
+
+def main():
+    """Main function to run the Baltic Exchange scraper."""
+    args = _PARSER.parse_args()
     
     # Set logging level
     if args.verbose:
         logging.getLogger().setLevel(logging.DEBUG)
     
     try:
+        # Imported here so --help and argument errors skip loading requests/bs4
+        from src.baltic_exchange_scraper import BalticExchangeScraper
+        
         # Initialize scraper
         logger.info("Initializing Baltic Exchange Scraper...")
         scraper = BalticExchangeScraper(data_dir=args.data_dir)
         
-        # Test connection if requested
-        if args.test_connection:
-            logger.info("Testing connection to Baltic Exchange...")
-            result = scraper.test_connection()
-            print("\n" + "="*50)
-            print("CONNECTION TEST RESULTS")
-            print("="*50)
-            print(f"Status: {result['status']}")
-            print(f"Message: {result['message']}")
-            print(f"Response Time: {result['response_time_seconds']}s")
-            print(f"Endpoint: {result['api_endpoint']}")
-            return
-        
-        # Show statistics only if requested
-        if args.stats_only:
-            logger.info("Getting statistics...")
-            stats = scraper.get_statistics()
-            print("\n" + "="*50)
-            print("MARKET DATA STATISTICS")
-            print("="*50)
-            print(f"Total Entries: {stats['total_entries']}")
-            print(f"Last Update: {stats['last_update']}")
-            print(f"Update Count: {stats['update_count']}")
-            
-            if stats['bdi_summary']['current']:
-                print(f"\nBDI Summary:")
-                print(f"  Current: {stats['bdi_summary']['current']}")
-                print(f"  Min: {stats['bdi_summary']['min']}")
-                print(f"  Max: {stats['bdi_summary']['max']}")
-                print(f"  Average: {stats['bdi_summary']['average']:.2f}")
-            
-            if stats['p5_summary']['current']:
-                print(f"\nP5 Summary:")
-                print(f"  Current: {stats['p5_summary']['current']}")
-                print(f"  Min: {stats['p5_summary']['min']}")
-                print(f"  Max: {stats['p5_summary']['max']}")
-                print(f"  Average: {stats['p5_summary']['average']:.2f}")
-            
-            # Show BDI trend
-            trend = scraper.get_bdi_trend(days=args.trend_days)
-            if trend['trend'] != 'insufficient_data':
-                print(f"\nBDI Trend ({args.trend_days} days):")
-                print(f"  Direction: {trend['trend'].upper()}")
-                print(f"  Change: {trend['change']} ({trend['change_percentage']}%)")
-                print(f"  Start: {trend['start_value']} → End: {trend['end_value']}")
-                print(f"  Data Points: {trend['data_points']}")
-            else:
-                print(f"\nBDI Trend: Insufficient data for {args.trend_days} days")
-            
-            return
-        
-        # Update market data
-        logger.info("Starting market data update...")
-        result = scraper.update_market_data(force_update=args.force)
-        
-        # Display results
-        print("\n" + "="*50)
-        print("UPDATE RESULTS")
-        print("="*50)
-        print(f"Status: {result['status']}")
-        print(f"Message: {result['message']}")
-        
-        if result['status'] == 'success':
-            print(f"New Entries: {result['new_entries']}")
-            print(f"Total Entries: {result['total_entries']}")
-            print(f"Duration: {result['duration_seconds']}s")
-            print(f"Last Update: {result['last_update']}")
-            
-            if result.get('bdi_value'):
-                print(f"BDI Value: {result['bdi_value']}")
-            if result.get('p5_value'):
-                print(f"P5 Value: {result['p5_value']}")
-        
-        elif result['status'] == 'skipped':
-            print(f"Last Update: {result['last_update']}")
-            print(f"Total Entries: {result['total_entries']}")
-        
-        # Show latest data
-        latest_data = scraper.get_latest_data()
-        if latest_data:
-            print(f"\n" + "="*50)
-            print("LATEST MARKET DATA")
-            print("="*50)
-            print(f"Scraped At: {latest_data.get('scraped_at', 'N/A')}")
-            
-            bdi = latest_data.get('bdi', {})
-            if bdi.get('current_value'):
-                print(f"BDI: {bdi['current_value']}")
-                if bdi.get('change'):
-                    change_str = f"{bdi['change']:+}"
-                    if bdi.get('change_percentage'):
-                        change_str += f" ({bdi['change_percentage']:+.2f}%)"
-                    print(f"BDI Change: {change_str}")
-            
-            p5 = latest_data.get('p5', {})
-            if p5.get('summary', {}).get('value'):
-                print(f"P5: {p5['summary']['value']}")
-            
-            bulk_rates = latest_data.get('bulk_rates', {})
-            if any(bulk_rates.get(vt, {}).get('rate') for vt in ['capesize', 'panamax', 'supramax', 'handysize']):
-                print("Bulk Rates:")
-                for vessel_type in ['capesize', 'panamax', 'supramax', 'handysize']:
-                    rate = bulk_rates.get(vessel_type, {}).get('rate')
-                    if rate:
-                        print(f"  {vessel_type.title()}: {rate}")
-            
-            market_summary = latest_data.get('market_summary', {})
-            if market_summary.get('market_sentiment'):
-                print(f"Market Sentiment: {market_summary['market_sentiment']}")
-        
-        # Export to CSV if requested
-        if args.export_csv:
-            logger.info("Exporting data to CSV...")
-            csv_data = scraper.export_csv()
-            
-            if csv_data:
-                # Determine output file
-                if args.csv_file:
-                    csv_file = args.csv_file
-                else:
-                    timestamp = datetime.now().strftime("%Y-%m-%d")
-                    csv_file = f"market_data_{timestamp}.csv"
-                
-                # Write CSV file
-                with open(csv_file, 'w', encoding='utf-8') as f:
-                    f.write(csv_data)
-                
-                print(f"\nData exported to: {csv_file}")
-                print(f"CSV contains {len(csv_data.splitlines()) - 1} data rows")
-            else:
-                print("\nNo data available for CSV export")
+        for flag, action in _EXCLUSIVE_ACTIONS:
+            if getattr(args, flag):
+                action(scraper, args)
+                return
         
-        # Show summary statistics
-        stats = scraper.get_statistics()
-        print(f"\n" + "="*50)
-        print("SUMMARY")
-        print("="*50)
-        print(f"Total Data Entries: {stats['total_entries']}")
-        print(f"Weekly Reports Summary:")
-        all_data = scraper.get_market_data()
-        if all_data:
-            total_reports = 0
-            for entry in all_data:
-                if entry.get('weekly_reports'):
-                    total_reports += len(entry['weekly_reports'])
-            print(f"  Total Weekly Reports: {total_reports}")
-            print(f"  Data Entries: {len(all_data)}")
-        else:
-            print(f"  No data available")
+        for flag, action in _UPDATE_ACTIONS:
+            if flag is None or getattr(args, flag):
+                action(scraper, args)
         
         logger.info("Baltic Exchange scraper completed successfully")
         
@@ -269,7 +339,7 @@ Examples:
         sys.exit(1)
         
     except Exception as e:
-        logger.error(f"Fatal error: {e}")
+        logger.error("Fatal error: %s", e)
         print(f"\nFATAL ERROR: {e}")
         sys.exit(1)
 
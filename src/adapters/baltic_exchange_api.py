@@ -3,23 +3,338 @@ Baltic Exchange API Client
 Client for scraping weekly market roundup data from Baltic Exchange website.
 """
 
+from __future__ import annotations
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import hashlib
 import logging
-from typing import List, Dict, Optional
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Optional, Tuple
 from datetime import datetime, date
+import threading
 import time
-import json
-from bs4 import BeautifulSoup
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import orjson
 import re
 
-# Set up logging
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from bs4 import BeautifulSoup
+
 logger = logging.getLogger(__name__)
 
+# Baltic Dry Index patterns, tried in priority order
+_BDI_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'BDI[:\s]*([0-9,]+)',
+    r'Baltic\s+Dry\s+Index[:\s]*([0-9,]+)',
+    r'([0-9,]+)\s*BDI',
+    r'BDI\s*=\s*([0-9,]+)',
+    r'BDI\s*([0-9,]+)',
+    r'([0-9,]+)\s*Baltic',
+    r'Index[:\s]*([0-9,]+)',
+))
+
+# Baltic Capesize Index 5TC patterns, tried in priority order
+_BCI_5TC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'BCI\s*5TC\s*(?:shedding|closing|at|reaching)\s*\$?([0-9,]+)',
+    r'BCI\s*5TC[:\s]*\$?([0-9,]+)',
+    r'5TC\s*(?:shedding|closing|at|reaching)\s*\$?([0-9,]+)',
+    r'BCI\s*5TC\s*\$?([0-9,]+)',
+    r'BCI\s*5TC\s*shedding\s*more\s*than\s*\$?[0-9,]+.*?closing\s*at\s*\$?([0-9,]+)',
+    r'5TC\s*shedding\s*more\s*than\s*\$?[0-9,]+.*?closing\s*at\s*\$?([0-9,]+)',
+    r'closing\s*at\s*\$?([0-9,]+)',
+))
+
+# Baltic Panamax Index 5TC patterns, tried in priority order
+_BPI_5TC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'BPI\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
+    r'BPI\s*5TC[:\s]*\$?([0-9,]+)',
+    r'Panamax\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
+    r'Panamax\s*5TC[:\s]*\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
+    r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*Panamax\s*(?:at|reported)\s*\$?([0-9,]+)',
+    r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+).*?Panamax',
+    # Look for specific Panamax rates mentioned in the text
+    r'Panamax.*?\$?([0-9,]+).*?delivery.*?Korea',
+    r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?Panamax.*?\$?([0-9,]+)',
+    # Look for the specific rate mentioned: "9 to 11 months trading reported late in the week at $15,250"
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?reported.*?\$?([0-9,]+)',
+    # Look for Panamax rates in context: "$30,000 reported on a super-spec 87,000-dwt type delivery Continent"
+    r'Panamax.*?\$?([0-9,]+).*?reported.*?delivery',
+    r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?\$?([0-9,]+)',
+    # Look for the specific rate: "9 to 11 months trading reported late in the week at $15,250"
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?reported.*?at\s*\$?([0-9,]+)',
+))
+
+# Baltic Supramax Index 5TC patterns, tried in priority order
+_BSI_5TC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'BSI\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
+    r'BSI\s*5TC[:\s]*\$?([0-9,]+)',
+    r'Supramax\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
+    r'Supramax\s*5TC[:\s]*\$?([0-9,]+)',
+    r'ultramax\s*(?:from|delivery|basis)\s*.*?\$?([0-9,]+)',
+    r'supramax\s*(?:from|delivery|basis)\s*.*?\$?([0-9,]+)',
+))
+
+# Index change patterns (absolute change with percentage, then percentage-only forms), tried in priority order
+_CHANGE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'([+-]?\d+(?:\.\d+)?)\s*\(([+-]?\d+(?:\.\d+)?)%\)',
+    r'([+-]?\d+(?:\.\d+)?)\s*%',
+    r'([+-]?\d+(?:\.\d+)?)\s*points?',
+    r'([+-]?\d+(?:\.\d+)?)\s*change',
+    r'shedding\s*more\s*than\s*\$?([0-9,]+)',
+    r'uptick\s*of\s*\$?([0-9,]+)',
+))
+
+# Report date patterns, tried in priority order
+_DATE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
+    r'(\d{4}-\d{2}-\d{2})',
+    r'(\d{1,2}/\d{1,2}/\d{4})',
+    r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
+))
+
+# Baltic Handysize Index patterns, tried in priority order
+_BHSI_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'BHSI[:\s]*([0-9,]+)',
+    r'(\d{1,3})%\s*of\s*BHSI',
+    r'BHSI\s*for\s*(\d{1,2})\s*years?\s*trading',
+))
+
+# P5/5TC summary value patterns, tried in priority order
+_P5_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'5TC[:\s]*([0-9,]+)',
+    r'P5[:\s]*([0-9,]+)',
+    r'5\s*Route\s*TC[:\s]*([0-9,]+)',
+    r'P5\s*rates?[:\s]*\$?([0-9,]+)',
+    r'P5\s*around\s*\$?([0-9,]+)',
+))
+
+# P5 route and time charter patterns, all applied
+_P5_ROUTE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(C3|C4|C5|C7|C9|C10|C14|C16)[:\s]*\$?([0-9,]+)',
+    r'(Panamax|Capesize|Supramax|Handysize)[:\s]*([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
+))
+
+# P5 mentions in running text, tried in priority order
+_P5_CONTEXT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'P5\s*(?:route|rates?)\s*(?:around|at|of)\s*\$?([0-9,]+)',
+    r'P5\s*(?:delivery|basis)\s*.*?\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*P5\s*at\s*\$?([0-9,]+)',
+))
+
+# Vessel class rates, in either (class, value) or (value, class) order
+_VESSEL_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?P<vessel>Capesize|Panamax|Supramax|Handysize)[:\s]*(?P<value>[0-9,]+)',
+    r'(?P<value>[0-9,]+)\s*(?P<vessel>Capesize|Panamax|Supramax|Handysize)',
+))
+
+# Route rates, in either (route, value) or (value, route) order
+_ROUTE_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(?P<route>C3|C4|C5|C7|C9|C10|C14|C16)[:\s]*\$?(?P<value>[0-9,]+)',
+    r'(?P<value>[0-9,]+)\s*(?P<route>C3|C4|C5|C7|C9|C10|C14|C16)',
+    r'(?P<route>C3|C4|C5|C7|C9|C10|C14|C16)\s*(?:rates?|bids?)\s*(?:around|at|of)\s*\$?(?P<value>[0-9,]+)',
+    r'(?:rates?|bids?)\s*(?:around|at|of)\s*\$?(?P<value>[0-9,]+)\s*(?:for|on)\s*(?P<route>C3|C4|C5|C7|C9|C10|C14|C16)',
+))
+
+# Vessel class each route is reported under
+_ROUTE_VESSEL_CLASSES = {
+    'C3': 'capesize', 'C4': 'capesize', 'C5': 'capesize', 'C7': 'capesize',
+    'C9': 'panamax', 'C10': 'panamax',
+    'C14': 'supramax', 'C16': 'supramax',
+}
+
+# Lowercased route codes; every route and context pattern names at least one of them
+_ROUTE_CODES = tuple(route.lower() for route in _ROUTE_VESSEL_CLASSES)
+
+# Route rates quoted in running text, as (pattern, vessel class, route)
+_CONTEXT_PATTERNS = tuple((re.compile(pattern, re.IGNORECASE), vessel_class, route) for pattern, vessel_class, route in (
+    (r'C5\s*rates?\s*below\s*\$?([0-9,]+)', 'capesize', 'C5'),
+    (r'C5\s*rates?\s*around\s*\$?([0-9,]+)', 'capesize', 'C5'),
+    (r'C3\s*bids?\s*around\s*\$?([0-9,]+)', 'capesize', 'C3'),
+    (r'C3\s*bids?\s*at\s*\$?([0-9,]+)', 'capesize', 'C3'),
+    (r'C9\s*rates?\s*around\s*\$?([0-9,]+)', 'panamax', 'C9'),
+    (r'C10\s*rates?\s*around\s*\$?([0-9,]+)', 'panamax', 'C10'),
+))
+
+# Time charter (period, rate) patterns
+_TC_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
+    r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
+))
+
+# Market sentiment words, tried in priority order
+_SENTIMENT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(bullish|bearish|neutral|positive|negative)',
+    r'(strengthening|weakening|stable|volatile)',
+    r'(up|down|flat|steady)',
+))
+
+# Key highlight figures
+_HIGHLIGHT_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'([0-9,]+)\s*%',
+    r'([0-9,]+)\s*(increase|decrease|rise|fall|gain|loss)',
+))
+
+# Trend indicators
+_TREND_PATTERNS = tuple(re.compile(pattern, re.IGNORECASE) for pattern in (
+    r'(trending|trend|direction)[:\s]*(up|down|sideways|stable)',
+    r'(market|freight|rates)[:\s]*(up|down|sideways|stable)',
+))
+
+# Weekly report section headers
+_SECTION_PATTERNS: Tuple[Tuple[re.Pattern, str], ...] = tuple((re.compile(pattern, re.IGNORECASE), section_name) for pattern, section_name in (
+    (r'Capesize', 'capesize'),
+    (r'Panamax', 'panamax'),
+    (r'Ultramax.*?Supramax', 'ultramax_supramax'),
+    (r'Handysize', 'handysize'),
+))
+
+# Page chrome that ends the last section of a report
+_SECTION_END_RE = re.compile(r'Previous|Next|Latest News|Read More')
+
+# Alternative patterns that look for content after specific keywords, used when no headers are found.
+# Each is (header, keyword, end markers, section): the section runs from the first header to the first
+# end marker after the first keyword that follows it, found with forward searches instead of backtracking
+_ALT_PATTERNS = tuple(
+    (re.compile(header, re.IGNORECASE), re.compile(keyword, re.IGNORECASE),
+     re.compile(end_markers, re.IGNORECASE), section_name)
+    for header, keyword, end_markers, section_name in (
+        # Capesize patterns
+        (r'Capesize', r'The Capesize market', r'Panamax', 'capesize'),
+        (r'Capesize', r'market', r'Panamax', 'capesize'),
+        
+        # Panamax patterns
+        (r'Panamax', r'The excitement', r'Ultramax|Supramax', 'panamax'),
+        (r'Panamax', r'market', r'Ultramax|Supramax', 'panamax'),
+        
+        # Ultramax/Supramax patterns
+        (r'Ultramax', r'Supramax', r'Handysize', 'ultramax_supramax'),
+        (r'Ultramax', r'Despite', r'Handysize', 'ultramax_supramax'),
+        
+        # Handysize patterns
+        (r'Handysize', r'Like', r'Previous|Next', 'handysize'),
+        (r'Handysize', r'sector', r'Previous|Next', 'handysize'),
+    )
+)
+
+# Site chrome stripped from extracted section text
+_BOILERPLATE_TEXTS = (
+    'This site uses cookies',
+    'We use cookies to ensure that we give you the best experience on our website',
+    'If you click "Accept Cookies", or continue without changing your settings, you consent to their use',
+    'You can change your settings at any time',
+    'To learn more about how we collect and use cookies, and how you configure or disable cookies please read our Cookie Policy',
+    'Menu Home Who We Are',
+    'Data Services',
+    'Membership Services',
+    'Media & Events',
+    'Free Trial KYC Emissions',
+    'Who We Are',
+    '中文 My Baltic',
+    'What can we help you find?',
+    'Home Data Services Weekly Market Roundups 2025 Dry Back to All',
+    'Previous Next Latest News Read More About',
+    'Who we are Corporate Governance Our History Membership Services FAQ\'s',
+    'Data services Free Trial Market Information Freight Derivatives Methodology',
+    'Connect Apply Newsletter News & Events Baltic App Contact us',
+    'Follow X LinkedIn Vimeo Instagram',
+    'Data Policy Privacy Policy Terms and Conditions Baltic Rules Cookies Sitemap',
+)
+
+# Longest phrase first, so a full navigation line wins over shorter phrases it contains
+_BOILERPLATE_RE = re.compile('|'.join(
+    re.escape(text) for text in sorted(_BOILERPLATE_TEXTS, key=len, reverse=True)
+))
+
+# Phrases that mark an anti-bot challenge page ("challenge" also covers "challenge validation")
+_CHALLENGE_RE = re.compile('|'.join(re.escape(indicator) for indicator in (
+    "challenge",
+    "security check",
+    "bot protection",
+    "cloudflare",
+    "please wait",
+    "checking your browser",
+    "ddos protection",
+)), re.IGNORECASE)
+
+# Elements that can hold a report's main content; everything else is skipped while parsing
+_CONTENT_TAGS = ('main', 'article', 'div')
+
+# Query for the weekly roundup listing, sent as params on GET and as form data on POST
+_LISTING_PARAMS = {
+    'resource': '/content/balticexchange/consumer/en/data-services/WeeklyRoundup/jcr:content/articlefilterpane',
+    'start': 0,
+    'selectedYear': 0,
+    'loadedCount': 0
+}
+
+# Fallback listing requests tried in order when the JSON endpoint serves a challenge page:
+# (label, HTTP method, extra headers, keyword carrying _LISTING_PARAMS). Like the main fetch,
+# they revalidate the listing instead of taking a cached copy
+_FALLBACK_ATTEMPTS = (
+    ('Alternative headers', 'GET', {
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+        'Accept': 'application/json',
+        'Accept-Language': 'en-US,en;q=0.9',
+        'Accept-Encoding': 'gzip, deflate, br',
+        'Connection': 'keep-alive',
+        'Referer': 'https://www.balticexchange.com/',
+        'Origin': 'https://www.balticexchange.com',
+        'Cache-Control': 'no-cache',
+    }, 'params'),
+    ('POST request', 'POST', {'Cache-Control': 'no-cache'}, 'data'),
+)
+
+class RateLimiter:
+    """
+    Thread-safe limiter allowing one request start per `interval` seconds on average.
+    
+    Up to `burst` requests may start back to back (e.g. one per concurrent worker);
+    after that, starts are spaced `interval` apart. With burst=1 every start is spaced.
+    """
+    
+    __slots__ = ('interval', 'burst', '_next_slot', '_lock')
+    
+    def __init__(self, interval: float, burst: int = 1):
+        self.interval = interval
+        self.burst = max(1, burst)
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def wait(self) -> None:
+        """Block only until the request fits within the rate budget."""
+        if self.interval <= 0:
+            return
+        
+        # Reserve a slot under the lock, then sleep outside it so other threads can queue up.
+        # A slot may start up to (burst - 1) intervals ahead of its place in the schedule.
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            start = max(now, slot - (self.burst - 1) * self.interval)
+            self._next_slot = slot + self.interval
+        
+        if start > now:
+            time.sleep(start - now)
+
 class BalticExchangeAPIClient:
     """API client for Baltic Exchange weekly market roundup data."""
     
-    def __init__(self, delay_between_requests: float = 2.0):
+    __slots__ = (
+        'base_url', 'weekly_roundup_url', 'reports_json_url', 'delay',
+        'rate_limiter', 'max_workers', 'cache_dir', 'report_cache_ttl', 'session'
+    )
+    
+    def __init__(self, delay_between_requests: float = 2.0, max_workers: int = 4,
+                 cache_dir: Optional[str] = None, report_cache_ttl: float = 30 * 24 * 3600):
         """Initialize Baltic Exchange API client."""
         
         self.base_url = "https://www.balticexchange.com"
@@ -27,6 +342,14 @@ class BalticExchangeAPIClient:
         # New JSON endpoint for weekly reports
         self.reports_json_url = "/bin/public/balticexchange/consumer/articlefilterlist.json"
         self.delay = delay_between_requests
+        # Shared by all requests: each report worker can start at once, then the delay paces the rest
+        self.rate_limiter = RateLimiter(delay_between_requests, burst=max_workers)
+        # Number of report pages fetched in parallel
+        self.max_workers = max_workers
+        # Directory for the conditional-GET cache of the reports listing (disabled if None)
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        # Seconds a fetched report's text is reused before it is downloaded again
+        self.report_cache_ttl = report_cache_ttl
         
         # Set up session with proper headers
         self.session = requests.Session()
@@ -34,116 +357,196 @@ class BalticExchangeAPIClient:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
             'Accept': 'application/json, text/plain, */*',
             'Accept-Language': 'en-US,en;q=0.9',
-            'Accept-Encoding': 'identity',  # Don't accept compressed content
+            'Accept-Encoding': 'gzip, deflate',  # Decoded transparently by urllib3
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
             'Sec-Fetch-Dest': 'empty',
             'Sec-Fetch-Mode': 'cors',
             'Sec-Fetch-Site': 'same-origin',
-            'Cache-Control': 'no-cache',
             'Referer': 'https://www.balticexchange.com/en/data-services/WeeklyRoundup.html',
             'DNT': '1',
             'X-Requested-With': 'XMLHttpRequest',
         })
         
+        # Keep-alive pool sized for the concurrent report fetches, with retries on transient errors
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers,
+            pool_maxsize=self.max_workers,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(429, 500, 502, 503, 504),
+                raise_on_status=False
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
         logger.info("Baltic Exchange API client initialized successfully")
     
-    def get_weekly_roundup_data(self) -> Dict:
+    def get_weekly_roundup_data(self, skip_if_unchanged: bool = False) -> Dict:
         """
         Fetch weekly market roundup data from Baltic Exchange using JSON endpoint.
         
+        Args:
+            skip_if_unchanged: Return a "not_modified" status instead of re-processing
+                the cached listing when the server answers 304 Not Modified
+        
         Returns:
             Dictionary with weekly market data including BDI, P5, and bulk rates
         """
+        # One timestamp for the whole fetch, shared by the result and any error status
+        scraped_at = datetime.now().isoformat()
+        
         try:
             # Use the JSON endpoint instead of HTML scraping
             url = f"{self.base_url}{self.reports_json_url}"
-            params = {
-                'resource': '/content/balticexchange/consumer/en/data-services/WeeklyRoundup/jcr:content/articlefilterpane',
-                'start': 0,
-                'selectedYear': 0,
-                'loadedCount': 0
-            }
+            params = _LISTING_PARAMS
+            
+            logger.info("Fetching weekly reports data from: %s", url)
+            logger.info("Parameters: %s", params)
             
-            logger.info(f"Fetching weekly reports data from: {url}")
-            logger.info(f"Parameters: {params}")
+            # Space requests out to be respectful
+            self.rate_limiter.wait()
             
-            # Add delay to be respectful
-            if self.delay > 0:
-                time.sleep(self.delay)
+            # Only the listing must be revalidated; published report pages can come from caches
+            headers = {'Cache-Control': 'no-cache', **self._conditional_headers()}
+            response = self.session.get(url, params=params, headers=headers, timeout=30)
+            
+            if response.status_code == 304:
+                logger.info("Weekly reports listing not modified since last fetch")
+                if skip_if_unchanged:
+                    return {
+                        "status": "not_modified",
+                        "message": "Weekly reports listing has not changed",
+                        "scraped_at": scraped_at
+                    }
+                reports_data = orjson.loads(self._listing_cache_files()[0].read_bytes())
+                return self._extract_market_data_from_json(reports_data, scraped_at)
             
-            response = self.session.get(url, params=params, timeout=30)
             response.raise_for_status()
             
             # Log response info for debugging
-            logger.info(f"Response status: {response.status_code}")
-            logger.info(f"Response headers: {dict(response.headers)}")
-            logger.info(f"Response encoding: {response.encoding}")
-            logger.info(f"Response content length: {len(response.content)}")
+            logger.info("Response status: %s", response.status_code)
+            logger.debug("Response headers: %s", response.headers)
+            logger.info("Response content length: %s", len(response.content))
             
-            # Parse JSON response
+            # Parse JSON response straight from the raw bytes with orjson
             try:
-                reports_data = response.json()
-                logger.info(f"Successfully parsed JSON response")
-                logger.info(f"Response keys: {list(reports_data.keys())}")
+                reports_data = orjson.loads(response.content)
+                logger.info("Successfully parsed JSON response")
+                logger.debug("Response keys: %s", list(reports_data))
                 
                 # Extract market data from JSON
-                market_data = self._extract_market_data_from_json(reports_data)
+                market_data = self._extract_market_data_from_json(reports_data, scraped_at)
+                
+                # Remember the listing only once all its reports are in, so a failed run is
+                # retried next time instead of being answered with 304 Not Modified
+                if "error" not in market_data and not market_data["raw_content"].get("failed_reports"):
+                    self._store_listing_cache(response)
                 
-                logger.info(f"Successfully extracted market data from JSON endpoint")
+                logger.info("Successfully extracted market data from JSON endpoint")
                 
                 return market_data
                 
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error: {e}")
-                logger.info(f"Response content: {response.text[:500]}")
+            except orjson.JSONDecodeError as e:
+                logger.error("JSON decode error: %s", e)
+                logger.info("Response content: %r", response.content[:500])
                 
                 # Check if we hit a challenge page
-                if "challenge validation" in response.text.lower():
+                if b"challenge validation" in response.content.lower():
                     logger.warning("JSON endpoint also hitting challenge page, trying alternative approach...")
-                    return self._try_alternative_json_access()
+                    return self._try_alternative_json_access(scraped_at)
                 
                 return {
                     "status": "json_error",
                     "message": f"Failed to parse JSON response: {e}",
-                    "scraped_at": datetime.now().isoformat()
+                    "scraped_at": scraped_at
                 }
             
         except requests.exceptions.RequestException as e:
-            logger.error(f"Request error fetching weekly reports: {e}")
+            logger.error("Request error fetching weekly reports: %s", e)
             return {}
         except Exception as e:
-            logger.error(f"Unexpected error fetching weekly reports: {e}")
+            logger.error("Unexpected error fetching weekly reports: %s", e)
             return {}
     
-    def _is_challenge_page(self, soup: BeautifulSoup) -> bool:
-        """Check if the page is a challenge/anti-bot protection page."""
-        page_title = soup.title.string if soup.title else ""
-        page_text = soup.get_text().lower()
+    def _listing_cache_files(self) -> Tuple[Path, Path]:
+        """Return the (body, metadata) paths of the reports listing cache."""
+        return (
+            self.cache_dir / "reports_listing_cache.json",
+            self.cache_dir / "reports_listing_cache_meta.json"
+        )
+    
+    def _conditional_headers(self) -> Dict:
+        """Build If-None-Match/If-Modified-Since headers from the cached listing validators."""
+        if not self.cache_dir:
+            return {}
         
-        challenge_indicators = [
-            "challenge validation",
-            "challenge",
-            "security check",
-            "bot protection",
-            "cloudflare",
-            "please wait",
-            "checking your browser",
-            "ddos protection"
-        ]
+        body_file, meta_file = self._listing_cache_files()
+        if not body_file.exists():
+            return {}
         
-        for indicator in challenge_indicators:
-            if indicator in page_title.lower() or indicator in page_text:
-                return True
+        return self._validator_headers(meta_file)
+    
+    @staticmethod
+    def _validator_headers(meta_file: Path) -> Dict:
+        """Turn a stored ETag/Last-Modified metadata file into conditional request headers."""
+        if not meta_file.exists():
+            return {}
         
-        # Check for very short content (typical of challenge pages)
-        if len(page_text.strip()) < 100:
+        try:
+            meta = orjson.loads(meta_file.read_bytes())
+        except (OSError, orjson.JSONDecodeError) as e:
+            logger.warning("Ignoring unreadable cache metadata %s: %s", meta_file.name, e)
+            return {}
+        
+        headers = {}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+        return headers
+    
+    def _store_listing_cache(self, response: requests.Response) -> None:
+        """Persist the listing body and its validators so later fetches can be conditional."""
+        if not self.cache_dir:
+            return
+        
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        body_file, meta_file = self._listing_cache_files()
+        meta = orjson.dumps({"etag": etag, "last_modified": last_modified})
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files and swap them in so readers never see a partial cache
+            for target, content in ((body_file, response.content), (meta_file, meta)):
+                tmp_file = target.with_suffix('.tmp')
+                tmp_file.write_bytes(content)
+                os.replace(tmp_file, target)
+        except OSError as e:
+            logger.warning("Could not write listing cache: %s", e)
+    
+    def _is_challenge_page(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> bool:
+        """Check if the page is a challenge/anti-bot protection page."""
+        page_title = (soup.title.string if soup.title else None) or ""
+        if page_text is None:
+            page_text = soup.get_text()
+        
+        if _CHALLENGE_RE.search(page_title) or _CHALLENGE_RE.search(page_text):
             return True
         
-        return False
+        # Check for very short content (typical of challenge pages)
+        return len(page_text.strip()) < 100
     
-    def _handle_challenge_page(self, soup: BeautifulSoup, url: str) -> Dict:
+    def _handle_challenge_page(self, soup: BeautifulSoup, url: str, page_text: Optional[str] = None) -> Dict:
         """Handle challenge pages and provide alternative approaches."""
+        if page_text is None:
+            page_text = soup.get_text()
+        
         challenge_data = {
             "scraped_at": datetime.now().isoformat(),
             "source_url": url,
@@ -157,7 +560,7 @@ class BalticExchangeAPIClient:
             ],
             "challenge_details": {
                 "page_title": soup.title.string if soup.title else None,
-                "content_length": len(soup.get_text()),
+                "content_length": len(page_text),
                 "detected_as_challenge": True
             },
             "alternative_approaches": [
@@ -171,83 +574,106 @@ class BalticExchangeAPIClient:
         
         return challenge_data
     
-    def _extract_market_data_from_json(self, reports_data: Dict) -> Dict:
+    def _extract_market_data_from_json(self, reports_data: Dict, scraped_at: Optional[str] = None) -> Dict:
         """
         Extract weekly report data from the JSON response.
         
         Args:
             reports_data: JSON response from the reports endpoint
+            scraped_at: ISO timestamp of the fetch (defaults to now)
             
         Returns:
             Dictionary with extracted weekly report data
         """
         market_data = {
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at or datetime.now().isoformat(),
             "source_url": f"{self.base_url}{self.reports_json_url}",
             "method": "json_api",
             "raw_content": {}
         }
         
         try:
+            articles = reports_data.get('articles', [])
+            
             # Store raw content for debugging
             market_data["raw_content"] = {
                 "has_more": reports_data.get('hasMore', False),
-                "total_articles": len(reports_data.get('articles', [])),
+                "total_articles": len(articles),
                 "response_structure": list(reports_data.keys())
             }
             
-            logger.info(f"Processing {len(reports_data.get('articles', []))} articles")
+            logger.info("Processing %s articles", len(articles))
             
-            # Find all Dry (bulk) reports from 2025
-            articles = reports_data.get('articles', [])
-            dry_reports = [article for article in articles if article.get('categoryId') == 'dry']
+            # Select Dry (bulk) reports from 2025 in a single pass over the articles
+            dry_count = 0
+            reports_to_fetch = []
+            
+            for report in articles:
+                if report.get('categoryId') != 'dry':
+                    continue
+                dry_count += 1
+                
+                report_title = report.get('newsTitle', '')
+                report_date = report.get('date', '')
+                
+                # Check if it's from 2025
+                if '2025' in report_date or '2025' in report_title:
+                    logger.info("Processing report: %s - %s", report_title, report_date)
+                    reports_to_fetch.append(report)
+                else:
+                    logger.debug("Skipping report from different year: %s - %s", report_title, report_date)
             
-            if dry_reports:
-                logger.info(f"Found {len(dry_reports)} dry reports")
+            if dry_count:
+                logger.info("Found %s dry reports", dry_count)
+                
+                # Fetch report pages concurrently and extract each one as soon as it arrives,
+                # so parsing overlaps the downloads still in flight
+                report_sections: List[Optional[Dict]] = [None] * len(reports_to_fetch)
+                # Never start more workers than there are pages to fetch
+                pool_size = max(1, min(self.max_workers, len(reports_to_fetch)))
+                with ThreadPoolExecutor(max_workers=pool_size) as executor:
+                    futures = {
+                        executor.submit(self._fetch_report_content, report.get('link')): index
+                        for index, report in enumerate(reports_to_fetch)
+                    }
+                    for future in as_completed(futures):
+                        report_content = future.result()
+                        if report_content:
+                            report_sections[futures[future]] = self._extract_weekly_report_content(report_content)
                 
-                # Process all dry reports from 2025
                 all_weekly_reports = []
                 
-                for report in dry_reports:
+                # Assemble results in the original report order
+                for report, weekly_data in zip(reports_to_fetch, report_sections):
                     report_title = report.get('newsTitle', '')
-                    report_date = report.get('date', '')
                     
-                    # Check if it's from 2025
-                    if '2025' in report_date or '2025' in report_title:
-                        logger.info(f"Processing report: {report_title} - {report_date}")
-                        
-                        # Try to fetch the actual report content
-                        report_content = self._fetch_report_content(report.get('link'))
-                        if report_content:
-                            # Extract weekly report data
-                            weekly_data = self._extract_weekly_report_content(report_content)
-                            weekly_report = {
-                                "week_number": report_title.split('Week ')[-1] if 'Week ' in report_title else '',
-                                "date_report": report_date,
-                                "category": report.get('category', ''),
-                                "link_report": report.get('link'),
-                                "capesize_content": weekly_data.get('capesize', ''),
-                                "panamax_content": weekly_data.get('panamax', ''),
-                                "ultramax_supramax_content": weekly_data.get('ultramax_supramax', ''),
-                                "handysize_content": weekly_data.get('handysize', '')
-                            }
-                            all_weekly_reports.append(weekly_report)
-                        else:
-                            logger.warning(f"Could not fetch content for report: {report_title}")
+                    if weekly_data is not None:
+                        weekly_report = {
+                            "week_number": report_title.split('Week ')[-1] if 'Week ' in report_title else '',
+                            "date_report": report.get('date', ''),
+                            "category": report.get('category', ''),
+                            "link_report": report.get('link'),
+                            "capesize_content": weekly_data.get('capesize', ''),
+                            "panamax_content": weekly_data.get('panamax', ''),
+                            "ultramax_supramax_content": weekly_data.get('ultramax_supramax', ''),
+                            "handysize_content": weekly_data.get('handysize', '')
+                        }
+                        all_weekly_reports.append(weekly_report)
                     else:
-                        logger.info(f"Skipping report from different year: {report_title} - {report_date}")
+                        logger.warning("Could not fetch content for report: %s", report_title)
                 
                 # Store all weekly reports
                 market_data["weekly_reports"] = all_weekly_reports
-                logger.info(f"Successfully processed {len(all_weekly_reports)} weekly reports from 2025")
+                market_data["raw_content"]["failed_reports"] = len(reports_to_fetch) - len(all_weekly_reports)
+                logger.info("Successfully processed %s weekly reports from 2025", len(all_weekly_reports))
             else:
                 logger.warning("No dry reports found in the response")
             
-            # Log what we found
-            logger.info(f"Weekly report extraction result: {market_data}")
+            # Dump the full result only when debugging; it carries every report's text
+            logger.debug("Weekly report extraction result: %s", market_data)
             
         except Exception as e:
-            logger.error(f"Error extracting market data from JSON: {e}")
+            logger.error("Error extracting market data from JSON: %s", e)
             market_data["error"] = str(e)
         
         return market_data
@@ -270,43 +696,33 @@ class BalticExchangeAPIClient:
         }
         
         try:
-            # Use regex to find sections more reliably
-            import re
-            
             # More robust section extraction - look for section headers and capture until next section
             sections = []
             
-            # Find all section headers first
-            section_patterns = [
-                (r'Capesize', 'capesize'),
-                (r'Panamax', 'panamax'), 
-                (r'Ultramax.*?Supramax', 'ultramax_supramax'),
-                (r'Handysize', 'handysize')
-            ]
-            
             # Find positions of all section headers
             section_positions = []
-            for pattern, section_name in section_patterns:
-                matches = list(re.finditer(pattern, text_content, re.IGNORECASE))
-                for match in matches:
+            for pattern, section_name in _SECTION_PATTERNS:
+                for match in pattern.finditer(text_content):
                     section_positions.append((match.start(), section_name, match.group(0)))
             
-            # Sort by position
-            section_positions.sort(key=lambda x: x[0])
+            # Sort by position (headers start with different letters, so positions never tie)
+            section_positions.sort()
             
-            # Extract content for each section
-            for i, (start_pos, section_name, header) in enumerate(section_positions):
+            # The last occurrence of a header with content wins, so walk the positions backwards,
+            # take the first content found for each section and stop once every section is set
+            found_sections = set()
+            for i in range(len(section_positions) - 1, -1, -1):
+                start_pos, section_name, header = section_positions[i]
+                if section_name in found_sections:
+                    continue
+                
                 # Find end position (next section or end of text)
                 if i + 1 < len(section_positions):
                     end_pos = section_positions[i + 1][0]
                 else:
-                    # For last section, go until common ending markers
-                    end_markers = ['Previous', 'Next', 'Latest News', 'Read More']
-                    end_pos = len(text_content)
-                    for marker in end_markers:
-                        marker_pos = text_content.find(marker, start_pos)
-                        if marker_pos != -1 and marker_pos < end_pos:
-                            end_pos = marker_pos
+                    # For last section, go until the earliest common ending marker
+                    end_match = _SECTION_END_RE.search(text_content, start_pos)
+                    end_pos = end_match.start() if end_match else len(text_content)
                 
                 # Extract section content
                 section_content = text_content[start_pos:end_pos].strip()
@@ -316,10 +732,13 @@ class BalticExchangeAPIClient:
                     # Remove common boilerplate text
                     section_content = self._clean_section_content(section_content)
                     weekly_data[section_name] = section_content
+                    found_sections.add(section_name)
                     
-                    logger.info(f"Extracted {section_name}: {len(section_content)} characters")
+                    logger.info("Extracted %s: %s characters", section_name, len(section_content))
+                    if len(found_sections) == len(weekly_data):
+                        break
                 else:
-                    logger.warning(f"No content found for {section_name}")
+                    logger.warning("No content found for %s", section_name)
             
             # Fallback: if no sections found with headers, try alternative patterns
             if not any(weekly_data.values()):
@@ -328,46 +747,18 @@ class BalticExchangeAPIClient:
             
 
             
-            logger.info(f"Weekly report content extracted: {list(weekly_data.keys())}")
-            logger.info(f"Content lengths: Capesize={len(weekly_data['capesize'])}, Panamax={len(weekly_data['panamax'])}, Ultramax/Supramax={len(weekly_data['ultramax_supramax'])}, Handysize={len(weekly_data['handysize'])}")
+            logger.info("Weekly report content extracted: %s", list(weekly_data.keys()))
+            logger.info("Content lengths: Capesize=%s, Panamax=%s, Ultramax/Supramax=%s, Handysize=%s", len(weekly_data['capesize']), len(weekly_data['panamax']), len(weekly_data['ultramax_supramax']), len(weekly_data['handysize']))
             
         except Exception as e:
-            logger.error(f"Error extracting weekly report content: {e}")
+            logger.error("Error extracting weekly report content: %s", e)
         
         return weekly_data
     
     def _clean_section_content(self, content: str) -> str:
         """Clean up section content by removing boilerplate text."""
-        # Remove common boilerplate text
-        boilerplate_texts = [
-            'This site uses cookies',
-            'We use cookies to ensure that we give you the best experience on our website',
-            'If you click "Accept Cookies", or continue without changing your settings, you consent to their use',
-            'You can change your settings at any time',
-            'To learn more about how we collect and use cookies, and how you configure or disable cookies please read our Cookie Policy',
-            'Menu Home Who We Are',
-            'Data Services',
-            'Membership Services',
-            'Media & Events',
-            'Free Trial KYC Emissions',
-            'Who We Are',
-            'Data Services',
-            'Membership Services',
-            'Media & Events',
-            'Free Trial KYC Emissions',
-            '中文 My Baltic',
-            'What can we help you find?',
-            'Home Data Services Weekly Market Roundups 2025 Dry Back to All',
-            'Previous Next Latest News Read More About',
-            'Who we are Corporate Governance Our History Membership Services FAQ\'s',
-            'Data services Free Trial Market Information Freight Derivatives Methodology',
-            'Connect Apply Newsletter News & Events Baltic App Contact us',
-            'Follow X LinkedIn Vimeo Instagram',
-            'Data Policy Privacy Policy Terms and Conditions Baltic Rules Cookies Sitemap'
-        ]
-        
-        for text in boilerplate_texts:
-            content = content.replace(text, '')
+        # Remove common boilerplate text in one pass
+        content = _BOILERPLATE_RE.sub('', content)
         
         # Clean up multiple spaces and normalize
         content = ' '.join(content.split())
@@ -375,105 +766,48 @@ class BalticExchangeAPIClient:
     
     def _extract_with_alternative_patterns(self, text_content: str, weekly_data: Dict) -> None:
         """Fallback extraction using alternative patterns when header-based extraction fails."""
-        import re
-        
-        # Alternative patterns that look for content after specific keywords
-        alternative_patterns = [
-            # Capesize patterns
-            (r'Capesize.*?The Capesize market.*?(?=Panamax|$)', 'capesize'),
-            (r'Capesize.*?market.*?(?=Panamax|$)', 'capesize'),
-            
-            # Panamax patterns  
-            (r'Panamax.*?The excitement.*?(?=Ultramax|Supramax|$)', 'panamax'),
-            (r'Panamax.*?market.*?(?=Ultramax|Supramax|$)', 'panamax'),
-            
-            # Ultramax/Supramax patterns
-            (r'Ultramax.*?Supramax.*?(?=Handysize|$)', 'ultramax_supramax'),
-            (r'Ultramax.*?Despite.*?(?=Handysize|$)', 'ultramax_supramax'),
-            
-            # Handysize patterns
-            (r'Handysize.*?Like.*?(?=Previous|Next|$)', 'handysize'),
-            (r'Handysize.*?sector.*?(?=Previous|Next|$)', 'handysize')
-        ]
-        
-        for pattern, section_name in alternative_patterns:
+        for header, keyword, end_markers, section_name in _ALT_PATTERNS:
             if not weekly_data.get(section_name):  # Only extract if not already found
-                match = re.search(pattern, text_content, re.DOTALL | re.IGNORECASE)
-                if match:
-                    content = match.group(0).strip()
+                header_match = header.search(text_content)
+                keyword_match = header_match and keyword.search(text_content, header_match.end())
+                if keyword_match:
+                    end_match = end_markers.search(text_content, keyword_match.end())
+                    end_pos = end_match.start() if end_match else len(text_content)
+                    content = text_content[header_match.start():end_pos].strip()
                     if content:
                         content = self._clean_section_content(content)
                         weekly_data[section_name] = content
-                        logger.info(f"Alternative pattern found for {section_name}: {len(content)} characters")
+                        logger.info("Alternative pattern found for %s: %s characters", section_name, len(content))
                         break
     
-    def _try_alternative_json_access(self) -> Dict:
+    def _try_alternative_json_access(self, scraped_at: Optional[str] = None) -> Dict:
         """Try alternative methods to access the JSON endpoint."""
         logger.info("Attempting alternative JSON access methods...")
+        scraped_at = scraped_at or datetime.now().isoformat()
         
-        # Method 1: Try with different headers
-        try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Accept': 'application/json',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Referer': 'https://www.balticexchange.com/',
-                'Origin': 'https://www.balticexchange.com',
-            }
-            
-            url = f"{self.base_url}{self.reports_json_url}"
-            params = {
-                'resource': '/content/balticexchange/consumer/en/data-services/WeeklyRoundup/jcr:content/articlefilterpane',
-                'start': 0,
-                'selectedYear': 0,
-                'loadedCount': 0
-            }
-            
-            logger.info("Trying alternative headers approach...")
-            response = self.session.get(url, params=params, headers=headers, timeout=30)
-            
-            if response.status_code == 200:
-                try:
-                    reports_data = response.json()
-                    logger.info("Alternative headers approach successful!")
-                    return self._extract_market_data_from_json(reports_data)
-                except json.JSONDecodeError:
-                    logger.warning("Alternative headers still returning invalid JSON")
-        
-        except Exception as e:
-            logger.error(f"Alternative headers approach failed: {e}")
-        
-        # Method 2: Try with a POST request
-        try:
-            logger.info("Trying POST request approach...")
-            post_data = {
-                'resource': '/content/balticexchange/consumer/en/data-services/WeeklyRoundup/jcr:content/articlefilterpane',
-                'start': 0,
-                'selectedYear': 0,
-                'loadedCount': 0
-            }
-            
-            response = self.session.post(url, data=post_data, timeout=30)
-            
-            if response.status_code == 200:
-                try:
-                    reports_data = response.json()
-                    logger.info("POST request approach successful!")
-                    return self._extract_market_data_from_json(reports_data)
-                except json.JSONDecodeError:
-                    logger.warning("POST request still returning invalid JSON")
-        
-        except Exception as e:
-            logger.error(f"POST request approach failed: {e}")
+        url = f"{self.base_url}{self.reports_json_url}"
+        for label, method, headers, payload_kw in _FALLBACK_ATTEMPTS:
+            try:
+                logger.info("Trying %s approach...", label)
+                response = self.session.request(method, url, headers=headers, timeout=30, **{payload_kw: _LISTING_PARAMS})
+                
+                if response.status_code == 200:
+                    try:
+                        reports_data = orjson.loads(response.content)
+                        logger.info("%s approach successful!", label)
+                        return self._extract_market_data_from_json(reports_data, scraped_at)
+                    except orjson.JSONDecodeError:
+                        logger.warning("%s still returning invalid JSON", label)
+            
+            except Exception as e:
+                logger.error("%s approach failed: %s", label, e)
         
         # If all methods fail, return error
         logger.error("All alternative JSON access methods failed")
         return {
             "status": "all_methods_failed",
             "message": "All JSON access methods are blocked by anti-bot protection",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at,
             "recommendations": [
                 "The JSON endpoint is also protected by anti-bot measures",
                 "Consider using official API access",
@@ -492,35 +826,108 @@ class BalticExchangeAPIClient:
         Returns:
             Report content as text, or None if failed
         """
+        # Published reports don't change, so reuse recently fetched text
+        cache_file = self._report_cache_file(report_url)
+        cached_text, is_fresh = self._read_report_cache(cache_file)
+        if is_fresh:
+            logger.info("Using cached report content for: %s", report_url)
+            return cached_text
+        
         try:
-            logger.info(f"Fetching report content from: {report_url}")
+            logger.info("Fetching report content from: %s", report_url)
+            
+            # Space requests out to be respectful
+            self.rate_limiter.wait()
             
-            # Add delay to be respectful
-            if self.delay > 0:
-                time.sleep(self.delay)
+            # Revalidate stale cached text instead of downloading the page again
+            headers = self._validator_headers(self._report_meta_file(cache_file)) if cached_text is not None else {}
+            response = self.session.get(report_url, headers=headers, timeout=30)
+            
+            if response.status_code == 304 and cached_text is not None:
+                logger.info("Report not modified since last fetch: %s", report_url)
+                self._refresh_report_cache(cache_file)
+                return cached_text
             
-            response = self.session.get(report_url, timeout=30)
             response.raise_for_status()
             
-            # Parse HTML to extract text content
-            soup = BeautifulSoup(response.content, 'html.parser')
+            # bs4 is only needed once a page is actually downloaded, so import it here
+            from bs4 import BeautifulSoup, SoupStrainer
+            
+            # Parse HTML with lxml's C tokenizer, building only the candidate content containers
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer(_CONTENT_TAGS))
             
             # Try to find the main content area
             main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
             
             if main_content:
                 content_text = main_content.get_text(separator=' ', strip=True)
-                logger.info(f"Successfully extracted {len(content_text)} characters of report content")
-                return content_text
+                logger.info("Successfully extracted %s characters of report content", len(content_text))
             else:
-                # Fallback to body text
+                # Fallback to body text, which needs the whole document
+                soup = BeautifulSoup(response.content, 'lxml')
                 content_text = soup.get_text(separator=' ', strip=True)
-                logger.info(f"Using fallback content extraction: {len(content_text)} characters")
-                return content_text
+                logger.info("Using fallback content extraction: %s characters", len(content_text))
+            
+            self._store_report_cache(cache_file, content_text, response)
+            return content_text
                 
         except Exception as e:
-            logger.error(f"Error fetching report content: {e}")
+            logger.error("Error fetching report content: %s", e)
+            return None
+    
+    def _report_cache_file(self, report_url: str) -> Optional[Path]:
+        """Return the cache path for a report's extracted text, or None if caching is disabled."""
+        if not self.cache_dir or not report_url:
             return None
+        
+        key = hashlib.sha256(report_url.encode('utf-8')).hexdigest()
+        return self.cache_dir / "report_cache" / f"{key}.txt"
+    
+    @staticmethod
+    def _report_meta_file(cache_file: Path) -> Path:
+        """Return the path holding a cached report's HTTP validators."""
+        return cache_file.with_suffix('.meta.json')
+    
+    def _read_report_cache(self, cache_file: Optional[Path]) -> Tuple[Optional[str], bool]:
+        """Return (cached text or None, whether it is younger than the TTL)."""
+        if cache_file is None:
+            return None, False
+        
+        try:
+            age = time.time() - cache_file.stat().st_mtime
+            return cache_file.read_text(encoding='utf-8'), age <= self.report_cache_ttl
+        except OSError:
+            return None, False
+    
+    def _refresh_report_cache(self, cache_file: Path) -> None:
+        """Restart the TTL of cached text the server confirmed is unchanged."""
+        try:
+            os.utime(cache_file)
+        except OSError as e:
+            logger.warning("Could not refresh report cache: %s", e)
+    
+    def _store_report_cache(self, cache_file: Optional[Path], content_text: str,
+                            response: requests.Response) -> None:
+        """Persist extracted report text and its validators for later runs."""
+        if cache_file is None or not content_text:
+            return
+        
+        files = [(cache_file, content_text.encode('utf-8'))]
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if etag or last_modified:
+            meta = orjson.dumps({"etag": etag, "last_modified": last_modified})
+            files.append((self._report_meta_file(cache_file), meta))
+        
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files and swap them in so readers never see a partial cache
+            for target, content in files:
+                tmp_file = target.with_suffix('.tmp')
+                tmp_file.write_bytes(content)
+                os.replace(tmp_file, target)
+        except OSError as e:
+            logger.warning("Could not write report cache: %s", e)
     
     def _extract_bdi_data_from_text(self, text_content: str) -> Dict:
         """Extract BDI data from text content."""
@@ -549,70 +956,30 @@ class BalticExchangeAPIClient:
         }
         
         try:
-            # Search for BDI patterns with more variations
-            bdi_patterns = [
-                r'BDI[:\s]*([0-9,]+)',
-                r'Baltic\s+Dry\s+Index[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*BDI',
-                r'BDI\s*=\s*([0-9,]+)',
-                r'BDI\s*([0-9,]+)',
-                r'([0-9,]+)\s*Baltic',
-                r'Index[:\s]*([0-9,]+)',
-            ]
+            # Families anchored on a keyword are skipped outright when the keyword is absent
+            text_lower = text_content.lower()
             
-            for i, pattern in enumerate(bdi_patterns):
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            # Search for BDI patterns with more variations
+            for i, pattern in enumerate(_BDI_PATTERNS):
+                match = pattern.search(text_content)
                 if match:
-                    logger.info(f"BDI pattern {i+1} matched: {match.group(0)}")
+                    logger.debug("BDI pattern %s matched: %s", i+1, match.group(0))
                     bdi_data["current_value"] = int(match.group(1).replace(',', ''))
                     break
             
             # Look for BCI 5TC patterns (Baltic Capesize Index)
-            bci_patterns = [
-                r'BCI\s*5TC\s*(?:shedding|closing|at|reaching)\s*\$?([0-9,]+)',
-                r'BCI\s*5TC[:\s]*\$?([0-9,]+)',
-                r'5TC\s*(?:shedding|closing|at|reaching)\s*\$?([0-9,]+)',
-                r'BCI\s*5TC\s*\$?([0-9,]+)',
-                r'BCI\s*5TC\s*shedding\s*more\s*than\s*\$?[0-9,]+.*?closing\s*at\s*\$?([0-9,]+)',
-                r'5TC\s*shedding\s*more\s*than\s*\$?[0-9,]+.*?closing\s*at\s*\$?([0-9,]+)',
-                r'closing\s*at\s*\$?([0-9,]+)',
-            ]
-            
-            for i, pattern in enumerate(bci_patterns):
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            for i, pattern in enumerate(_BCI_5TC_PATTERNS):
+                match = pattern.search(text_content)
                 if match:
-                    logger.info(f"BCI 5TC pattern {i+1} matched: {match.group(0)}")
+                    logger.debug("BCI 5TC pattern %s matched: %s", i+1, match.group(0))
                     bdi_data["components"]["bci_5tc"] = int(match.group(1).replace(',', ''))
                     break
             
             # Look for BPI 5TC patterns (Baltic Panamax Index)
-            bpi_patterns = [
-                r'BPI\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
-                r'BPI\s*5TC[:\s]*\$?([0-9,]+)',
-                r'Panamax\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
-                r'Panamax\s*5TC[:\s]*\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
-                r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*Panamax\s*(?:at|reported)\s*\$?([0-9,]+)',
-                r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+).*?Panamax',
-                # Look for specific Panamax rates mentioned in the text
-                r'Panamax.*?\$?([0-9,]+).*?delivery.*?Korea',
-                r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?Panamax.*?\$?([0-9,]+)',
-                # Look for the specific rate mentioned: "9 to 11 months trading reported late in the week at $15,250"
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?reported.*?\$?([0-9,]+)',
-                # Look for Panamax rates in context: "$30,000 reported on a super-spec 87,000-dwt type delivery Continent"
-                r'Panamax.*?\$?([0-9,]+).*?reported.*?delivery',
-                r'Panamax.*?(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?\$?([0-9,]+)',
-                # Look for the specific rate: "9 to 11 months trading reported late in the week at $15,250"
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading.*?reported.*?at\s*\$?([0-9,]+)',
-            ]
-            
-            for i, pattern in enumerate(bpi_patterns):
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            for i, pattern in enumerate(_BPI_5TC_PATTERNS):
+                match = pattern.search(text_content)
                 if match:
-                    logger.info(f"BPI 5TC pattern {i+1} matched: {match.group(0)}")
+                    logger.debug("BPI 5TC pattern %s matched: %s", i+1, match.group(0))
                     # Extract the rate value from the matched text
                     if len(match.groups()) == 2:
                         # For patterns with 2 groups like (period, rate)
@@ -625,46 +992,29 @@ class BalticExchangeAPIClient:
                     if rate_value and rate_value.strip():
                         try:
                             bdi_data["components"]["bpi_5tc"] = int(rate_value.replace(',', ''))
-                            logger.info(f"Successfully extracted BPI 5TC: {bdi_data['components']['bpi_5tc']}")
+                            logger.debug("Successfully extracted BPI 5TC: %s", bdi_data['components']['bpi_5tc'])
                             break
                         except (ValueError, AttributeError) as e:
-                            logger.warning(f"Failed to parse BPI 5TC rate '{rate_value}': {e}")
+                            logger.warning("Failed to parse BPI 5TC rate '%s': %s", rate_value, e)
                             continue
                     else:
-                        logger.warning(f"Empty rate value found in BPI 5TC pattern {i+1}")
+                        logger.warning("Empty rate value found in BPI 5TC pattern %s", i+1)
                         continue
             
             # Look for BSI 5TC patterns (Baltic Supramax Index)
-            bsi_patterns = [
-                r'BSI\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
-                r'BSI\s*5TC[:\s]*\$?([0-9,]+)',
-                r'Supramax\s*5TC\s*(?:at|reaching|closing|around)\s*\$?([0-9,]+)',
-                r'Supramax\s*5TC[:\s]*\$?([0-9,]+)',
-                r'ultramax\s*(?:from|delivery|basis)\s*.*?\$?([0-9,]+)',
-                r'supramax\s*(?:from|delivery|basis)\s*.*?\$?([0-9,]+)',
-            ]
-            
-            for i, pattern in enumerate(bsi_patterns):
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    logger.info(f"BSI 5TC pattern {i+1} matched: {match.group(0)}")
-                    bdi_data["components"]["bsi_5tc"] = int(match.group(1).replace(',', ''))
-                    break
+            if any(hint in text_lower for hint in ('bsi', 'supramax', 'ultramax')):
+                for i, pattern in enumerate(_BSI_5TC_PATTERNS):
+                    match = pattern.search(text_content)
+                    if match:
+                        logger.debug("BSI 5TC pattern %s matched: %s", i+1, match.group(0))
+                        bdi_data["components"]["bsi_5tc"] = int(match.group(1).replace(',', ''))
+                        break
             
             # Look for change information with more patterns
-            change_patterns = [
-                r'([+-]?\d+(?:\.\d+)?)\s*\(([+-]?\d+(?:\.\d+)?)%\)',
-                r'([+-]?\d+(?:\.\d+)?)\s*%',
-                r'([+-]?\d+(?:\.\d+)?)\s*points?',
-                r'([+-]?\d+(?:\.\d+)?)\s*change',
-                r'shedding\s*more\s*than\s*\$?([0-9,]+)',
-                r'uptick\s*of\s*\$?([0-9,]+)',
-            ]
-            
-            for i, pattern in enumerate(change_patterns):
-                match = re.search(pattern, text_content)
+            for i, pattern in enumerate(_CHANGE_PATTERNS):
+                match = pattern.search(text_content)
                 if match:
-                    logger.info(f"Change pattern {i+1} matched: {match.group(0)}")
+                    logger.debug("Change pattern %s matched: %s", i+1, match.group(0))
                     if len(match.groups()) == 2:
                         bdi_data["change"] = float(match.group(1))
                         bdi_data["change_percentage"] = float(match.group(2))
@@ -673,39 +1023,27 @@ class BalticExchangeAPIClient:
                     break
             
             # Extract date information with more patterns
-            date_patterns = [
-                r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            ]
-            
-            for i, pattern in enumerate(date_patterns):
-                match = re.search(pattern, text_content)
+            for i, pattern in enumerate(_DATE_PATTERNS):
+                match = pattern.search(text_content)
                 if match:
-                    logger.info(f"Date pattern {i+1} matched: {match.group(0)}")
+                    logger.debug("Date pattern %s matched: %s", i+1, match.group(0))
                     bdi_data["date"] = match.group(1)
                     break
             
             # Look for BHSI (Baltic Handysize Index) patterns
-            bhsi_patterns = [
-                r'BHSI[:\s]*([0-9,]+)',
-                r'(\d{1,3})%\s*of\s*BHSI',
-                r'BHSI\s*for\s*(\d{1,2})\s*years?\s*trading',
-            ]
-            
-            for i, pattern in enumerate(bhsi_patterns):
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    logger.info(f"BHSI pattern {i+1} matched: {match.group(0)}")
-                    bdi_data["components"]["bhsi"] = match.group(1)
-                    break
+            if 'bhsi' in text_lower:
+                for i, pattern in enumerate(_BHSI_PATTERNS):
+                    match = pattern.search(text_content)
+                    if match:
+                        logger.debug("BHSI pattern %s matched: %s", i+1, match.group(0))
+                        bdi_data["components"]["bhsi"] = match.group(1)
+                        break
             
             # Log what we found
-            logger.info(f"BDI extraction result: {bdi_data}")
+            logger.debug("BDI extraction result: %s", bdi_data)
             
         except Exception as e:
-            logger.error(f"Error extracting BDI data: {e}")
+            logger.error("Error extracting BDI data: %s", e)
         
         return bdi_data
     
@@ -717,31 +1055,18 @@ class BalticExchangeAPIClient:
         }
         
         try:
-            # Look for P5/5TC route information
-            p5_patterns = [
-                r'5TC[:\s]*([0-9,]+)',
-                r'P5[:\s]*([0-9,]+)',
-                r'5\s*Route\s*TC[:\s]*([0-9,]+)',
-                r'P5\s*rates?[:\s]*\$?([0-9,]+)',
-                r'P5\s*around\s*\$?([0-9,]+)',
-            ]
+            text_lower = text_content.lower()
             
-            for pattern in p5_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            # Look for P5/5TC route information
+            for pattern in _P5_PATTERNS:
+                match = pattern.search(text_content)
                 if match:
                     p5_data["summary"]["value"] = int(match.group(1).replace(',', ''))
                     break
             
             # Look for individual route information with more context
-            route_patterns = [
-                r'(C3|C4|C5|C7|C9|C10|C14|C16)[:\s]*\$?([0-9,]+)',
-                r'(Panamax|Capesize|Supramax|Handysize)[:\s]*([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
-            ]
-            
-            for pattern in route_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
+            for pattern in _P5_ROUTE_PATTERNS:
+                matches = pattern.findall(text_content)
                 for match in matches:
                     if len(match) == 2:
                         if match[0].isdigit() or ',' in match[0]:
@@ -760,28 +1085,23 @@ class BalticExchangeAPIClient:
                             p5_data["routes"][route.upper()] = int(value.replace(',', ''))
             
             # Look for specific P5 route mentions
-            p5_context_patterns = [
-                r'P5\s*(?:route|rates?)\s*(?:around|at|of)\s*\$?([0-9,]+)',
-                r'P5\s*(?:delivery|basis)\s*.*?\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*P5\s*at\s*\$?([0-9,]+)',
-            ]
-            
-            for pattern in p5_context_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    if len(match.groups()) == 2:
-                        period, rate = match.groups()
-                        p5_data["summary"]["time_charter"] = {
-                            "period": period,
-                            "rate": int(rate.replace(',', ''))
-                        }
-                    else:
-                        rate = match.group(1)
-                        p5_data["summary"]["value"] = int(rate.replace(',', ''))
-                    break
+            if 'p5' in text_lower:
+                for pattern in _P5_CONTEXT_PATTERNS:
+                    match = pattern.search(text_content)
+                    if match:
+                        if len(match.groups()) == 2:
+                            period, rate = match.groups()
+                            p5_data["summary"]["time_charter"] = {
+                                "period": period,
+                                "rate": int(rate.replace(',', ''))
+                            }
+                        else:
+                            rate = match.group(1)
+                            p5_data["summary"]["value"] = int(rate.replace(',', ''))
+                        break
             
         except Exception as e:
-            logger.error(f"Error extracting P5 data: {e}")
+            logger.error("Error extracting P5 data: %s", e)
         
         return p5_data
     
@@ -796,82 +1116,34 @@ class BalticExchangeAPIClient:
         }
         
         try:
-            # Look for vessel type rates
-            vessel_patterns = [
-                r'(Capesize|Panamax|Supramax|Handysize)[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*(Capesize|Panamax|Supramax|Handysize)',
-            ]
+            text_lower = text_content.lower()
             
-            for pattern in vessel_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        if match[0].isdigit() or ',' in match[0]:
-                            value, vessel_type = match
-                        else:
-                            vessel_type, value = match
-                        
-                        vessel_type = vessel_type.lower()
-                        if vessel_type in bulk_rates:
-                            bulk_rates[vessel_type]["rate"] = int(value.replace(',', ''))
+            # Look for vessel type rates
+            for pattern in _VESSEL_PATTERNS:
+                for match in pattern.finditer(text_content):
+                    vessel_type = match['vessel'].lower()
+                    if vessel_type in bulk_rates:
+                        bulk_rates[vessel_type]["rate"] = int(match['value'].replace(',', ''))
             
             # Look for specific route rates with more context
-            route_patterns = [
-                r'(C3|C4|C5|C7|C9|C10|C14|C16)[:\s]*\$?([0-9,]+)',
-                r'([0-9,]+)\s*(C3|C4|C5|C7|C9|C10|C14|C16)',
-                r'(C3|C4|C5|C7|C9|C10|C14|C16)\s*(?:rates?|bids?)\s*(?:around|at|of)\s*\$?([0-9,]+)',
-                r'(?:rates?|bids?)\s*(?:around|at|of)\s*\$?([0-9,]+)\s*(?:for|on)\s*(C3|C4|C5|C7|C9|C10|C14|C16)',
-            ]
-            
-            for pattern in route_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        if match[0].isdigit() or ',' in match[0]:
-                            value, route = match
-                        else:
-                            route, value = match
-                        
-                        # Map routes to vessel types
-                        if route in ['C3', 'C4', 'C5', 'C7']:
-                            bulk_rates["capesize"][route] = int(value.replace(',', ''))
-                        elif route in ['C9', 'C10']:
-                            bulk_rates["panamax"][route] = int(value.replace(',', ''))
-                        elif route in ['C14', 'C16']:
-                            bulk_rates["supramax"][route] = int(value.replace(',', ''))
+            if any(route in text_lower for route in _ROUTE_CODES):
+                for pattern in _ROUTE_PATTERNS:
+                    for match in pattern.finditer(text_content):
+                        # Route codes are matched case-insensitively but only canonical ones are mapped
+                        vessel_class = _ROUTE_VESSEL_CLASSES.get(match['route'])
+                        if vessel_class:
+                            bulk_rates[vessel_class][match['route']] = int(match['value'].replace(',', ''))
             
             # Look for specific rate mentions in context
-            context_patterns = [
-                r'C5\s*rates?\s*below\s*\$?([0-9,]+)',
-                r'C5\s*rates?\s*around\s*\$?([0-9,]+)',
-                r'C3\s*bids?\s*around\s*\$?([0-9,]+)',
-                r'C3\s*bids?\s*at\s*\$?([0-9,]+)',
-                r'C9\s*rates?\s*around\s*\$?([0-9,]+)',
-                r'C10\s*rates?\s*around\s*\$?([0-9,]+)',
-            ]
-            
-            for pattern in context_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
-                if match:
-                    value = match.group(1)
-                    # Extract route from pattern
-                    if 'C5' in pattern:
-                        bulk_rates["capesize"]["C5"] = int(value.replace(',', ''))
-                    elif 'C3' in pattern:
-                        bulk_rates["capesize"]["C3"] = int(value.replace(',', ''))
-                    elif 'C9' in pattern:
-                        bulk_rates["panamax"]["C9"] = int(value.replace(',', ''))
-                    elif 'C10' in pattern:
-                        bulk_rates["panamax"]["C10"] = int(value.replace(',', ''))
+            if any(route in text_lower for route in _ROUTE_CODES):
+                for pattern, vessel_class, route in _CONTEXT_PATTERNS:
+                    match = pattern.search(text_content)
+                    if match:
+                        bulk_rates[vessel_class][route] = int(match.group(1).replace(',', ''))
             
             # Look for time charter rates
-            tc_patterns = [
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*trading\s*(?:at|reported)\s*\$?([0-9,]+)',
-                r'(\d{1,2}[-,\s]\d{1,2})\s*months?\s*at\s*\$?([0-9,]+)',
-            ]
-            
-            for pattern in tc_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
+            for pattern in _TC_PATTERNS:
+                matches = pattern.findall(text_content)
                 for match in matches:
                     if len(match) == 2:
                         period, rate = match
@@ -881,7 +1153,7 @@ class BalticExchangeAPIClient:
                         }
             
         except Exception as e:
-            logger.error(f"Error extracting bulk rates data: {e}")
+            logger.error("Error extracting bulk rates data: %s", e)
         
         return bulk_rates
     
@@ -895,280 +1167,46 @@ class BalticExchangeAPIClient:
         
         try:
             # Look for market sentiment indicators
-            sentiment_patterns = [
-                r'(bullish|bearish|neutral|positive|negative)',
-                r'(strengthening|weakening|stable|volatile)',
-                r'(up|down|flat|steady)',
-            ]
-            
-            for pattern in sentiment_patterns:
-                match = re.search(pattern, text_content, re.IGNORECASE)
+            for pattern in _SENTIMENT_PATTERNS:
+                match = pattern.search(text_content)
                 if match:
                     summary["market_sentiment"] = match.group(1).lower()
                     break
             
             # Look for key highlights (numbers and percentages)
-            highlight_patterns = [
-                r'([0-9,]+)\s*%',
-                r'([0-9,]+)\s*(increase|decrease|rise|fall|gain|loss)',
+            summary["key_highlights"] = [
+                f"{match[0]}% {match[1]}" if len(match) == 2 else f"{match[0]}%"
+                for pattern in _HIGHLIGHT_PATTERNS
+                for match in pattern.findall(text_content)
             ]
             
-            for pattern in highlight_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        value, change = match
-                        summary["key_highlights"].append(f"{value}% {change}")
-                    else:
-                        summary["key_highlights"].append(f"{match[0]}%")
-            
             # Look for trend indicators
-            trend_patterns = [
-                r'(trending|trend|direction)[:\s]*(up|down|sideways|stable)',
-                r'(market|freight|rates)[:\s]*(up|down|sideways|stable)',
+            summary["trends"] = [
+                f"{indicator} {direction}"
+                for pattern in _TREND_PATTERNS
+                for indicator, direction in pattern.findall(text_content)
             ]
             
-            for pattern in trend_patterns:
-                matches = re.findall(pattern, text_content, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        summary["trends"].append(f"{match[0]} {match[1]}")
-            
         except Exception as e:
-            logger.error(f"Error extracting market summary: {e}")
+            logger.error("Error extracting market summary: %s", e)
         
         return summary
     
-    def _extract_bdi_data(self, soup: BeautifulSoup) -> Dict:
-        """Extract BDI (Baltic Dry Index) data."""
-        bdi_data = {
-            "current_value": None,
-            "change": None,
-            "change_percentage": None,
-            "date": None,
-            "components": {}
-        }
-        
-        try:
-            # Look for BDI mentions in the content
-            page_text = soup.get_text()
-            logger.info(f"Page text length: {len(page_text)}")
-            logger.info(f"First 500 characters: {page_text[:500]}")
-            
-            # Search for BDI patterns with more variations
-            bdi_patterns = [
-                r'BDI[:\s]*([0-9,]+)',
-                r'Baltic\s+Dry\s+Index[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*BDI',
-                r'BDI\s*=\s*([0-9,]+)',
-                r'BDI\s*([0-9,]+)',
-                r'([0-9,]+)\s*Baltic',
-                r'Index[:\s]*([0-9,]+)',
-            ]
-            
-            for i, pattern in enumerate(bdi_patterns):
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    logger.info(f"BDI pattern {i+1} matched: {match.group(0)}")
-                    bdi_data["current_value"] = int(match.group(1).replace(',', ''))
-                    break
-            
-            # Look for change information with more patterns
-            change_patterns = [
-                r'([+-]?\d+(?:\.\d+)?)\s*\(([+-]?\d+(?:\.\d+)?)%\)',
-                r'([+-]?\d+(?:\.\d+)?)\s*%',
-                r'([+-]?\d+(?:\.\d+)?)\s*points?',
-                r'([+-]?\d+(?:\.\d+)?)\s*change',
-            ]
-            
-            for i, pattern in enumerate(change_patterns):
-                match = re.search(pattern, page_text)
-                if match:
-                    logger.info(f"Change pattern {i+1} matched: {match.group(0)}")
-                    if len(match.groups()) == 2:
-                        bdi_data["change"] = float(match.group(1))
-                        bdi_data["change_percentage"] = float(match.group(2))
-                    else:
-                        bdi_data["change_percentage"] = float(match.group(1))
-                    break
-            
-            # Extract date information with more patterns
-            date_patterns = [
-                r'(\d{1,2}\s+(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\s+\d{4})',
-                r'(\d{4}-\d{2}-\d{2})',
-                r'(\d{1,2}/\d{1,2}/\d{4})',
-                r'(\d{1,2}\s+(?:January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4})',
-            ]
-            
-            for i, pattern in enumerate(date_patterns):
-                match = re.search(pattern, page_text)
-                if match:
-                    logger.info(f"Date pattern {i+1} matched: {match.group(0)}")
-                    bdi_data["date"] = match.group(1)
-                    break
-            
-            # Log what we found
-            logger.info(f"BDI extraction result: {bdi_data}")
-            
-        except Exception as e:
-            logger.error(f"Error extracting BDI data: {e}")
-        
-        return bdi_data
+    def _extract_bdi_data(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract BDI (Baltic Dry Index) data; pass ``page_text`` when the soup has already been flattened."""
+        return self._extract_bdi_data_from_text_common(soup.get_text() if page_text is None else page_text)
     
-    def _extract_p5_data(self, soup: BeautifulSoup) -> Dict:
-        """Extract P5 (5TC routes) data."""
-        p5_data = {
-            "routes": {},
-            "summary": {}
-        }
-        
-        try:
-            page_text = soup.get_text()
-            
-            # Look for P5/5TC route information
-            p5_patterns = [
-                r'5TC[:\s]*([0-9,]+)',
-                r'P5[:\s]*([0-9,]+)',
-                r'5\s*Route\s*TC[:\s]*([0-9,]+)',
-            ]
-            
-            for pattern in p5_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    p5_data["summary"]["value"] = int(match.group(1).replace(',', ''))
-                    break
-            
-            # Look for individual route information
-            route_patterns = [
-                r'(C3|C4|C5|C7|C9)[:\s]*([0-9,]+)',
-                r'(Panamax|Capesize|Supramax)[:\s]*([0-9,]+)',
-            ]
-            
-            for pattern in route_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for route, value in matches:
-                    p5_data["routes"][route.upper()] = int(value.replace(',', ''))
-            
-        except Exception as e:
-            logger.error(f"Error extracting P5 data: {e}")
-        
-        return p5_data
+    def _extract_p5_data(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract P5 (5TC routes) data; pass ``page_text`` when the soup has already been flattened."""
+        return self._extract_p5_data_from_text_common(soup.get_text() if page_text is None else page_text)
     
-    def _extract_bulk_rates_data(self, soup: BeautifulSoup) -> Dict:
-        """Extract bulk rates data."""
-        bulk_rates = {
-            "capesize": {},
-            "panamax": {},
-            "supramax": {},
-            "handysize": {},
-            "summary": {}
-        }
-        
-        try:
-            page_text = soup.get_text()
-            
-            # Look for vessel type rates
-            vessel_patterns = [
-                r'(Capesize|Panamax|Supramax|Handysize)[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*(Capesize|Panamax|Supramax|Handysize)',
-            ]
-            
-            for pattern in vessel_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        if match[0].isdigit() or ',' in match[0]:
-                            value, vessel_type = match
-                        else:
-                            vessel_type, value = match
-                        
-                        vessel_type = vessel_type.lower()
-                        if vessel_type in bulk_rates:
-                            bulk_rates[vessel_type]["rate"] = int(value.replace(',', ''))
-            
-            # Look for specific route rates
-            route_patterns = [
-                r'(C3|C4|C5|C7|C9|C10|C14|C16)[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*(C3|C4|C5|C7|C9|C10|C14|C16)',
-            ]
-            
-            for pattern in route_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        if match[0].isdigit() or ',' in match[0]:
-                            value, route = match
-                        else:
-                            route, value = match
-                        
-                        # Map routes to vessel types
-                        if route in ['C3', 'C4', 'C5', 'C7']:
-                            bulk_rates["capesize"][route] = int(value.replace(',', ''))
-                        elif route in ['C9', 'C10']:
-                            bulk_rates["panamax"][route] = int(value.replace(',', ''))
-                        elif route in ['C14', 'C16']:
-                            bulk_rates["supramax"][route] = int(value.replace(',', ''))
-            
-        except Exception as e:
-            logger.error(f"Error extracting bulk rates data: {e}")
-        
-        return bulk_rates
+    def _extract_bulk_rates_data(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract bulk rates data; pass ``page_text`` when the soup has already been flattened."""
+        return self._extract_bulk_rates_data_from_text_common(soup.get_text() if page_text is None else page_text)
     
-    def _extract_market_summary(self, soup: BeautifulSoup) -> Dict:
-        """Extract general market summary information."""
-        summary = {
-            "market_sentiment": None,
-            "key_highlights": [],
-            "trends": []
-        }
-        
-        try:
-            page_text = soup.get_text()
-            
-            # Look for market sentiment indicators
-            sentiment_patterns = [
-                r'(bullish|bearish|neutral|positive|negative)',
-                r'(strengthening|weakening|stable|volatile)',
-                r'(up|down|flat|steady)',
-            ]
-            
-            for pattern in sentiment_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
-                if match:
-                    summary["market_sentiment"] = match.group(1).lower()
-                    break
-            
-            # Look for key highlights (numbers and percentages)
-            highlight_patterns = [
-                r'([0-9,]+)\s*%',
-                r'([0-9,]+)\s*(increase|decrease|rise|fall|gain|loss)',
-            ]
-            
-            for pattern in highlight_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        value, change = match
-                        summary["key_highlights"].append(f"{value}% {change}")
-                    else:
-                        summary["key_highlights"].append(f"{match[0]}%")
-            
-            # Look for trend indicators
-            trend_patterns = [
-                r'(trending|trend|direction)[:\s]*(up|down|sideways|stable)',
-                r'(market|freight|rates)[:\s]*(up|down|sideways|stable)',
-            ]
-            
-            for pattern in trend_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for match in matches:
-                    if len(match) == 2:
-                        summary["trends"].append(f"{match[0]} {match[1]}")
-            
-        except Exception as e:
-            logger.error(f"Error extracting market summary: {e}")
-        
-        return summary
+    def _extract_market_summary(self, soup: BeautifulSoup, page_text: Optional[str] = None) -> Dict:
+        """Extract general market summary information; pass ``page_text`` when the soup has already been flattened."""
+        return self._extract_market_summary_from_text_common(soup.get_text() if page_text is None else page_text)
     
     def get_historical_data(self, year: int = None) -> List[Dict]:
         """
@@ -1190,13 +1228,13 @@ class BalticExchangeAPIClient:
                 if year == current_year:
                     return [current_data]
                 else:
-                    logger.warning(f"Historical data for year {year} not yet implemented")
+                    logger.warning("Historical data for year %s not yet implemented", year)
                     return []
             
             return [current_data]
             
         except Exception as e:
-            logger.error(f"Error fetching historical data: {e}")
+            logger.error("Error fetching historical data: %s", e)
             return []
     
     def test_connection(self) -> Dict:
@@ -1239,7 +1277,7 @@ class BalticExchangeAPIClient:
                 "api_endpoint": f"{self.base_url}{self.weekly_roundup_url}"
             }
 
-    def _calculate_bdi(self, capesize_5tc: int, panamax_5tc: int, supramax_5tc: int) -> float:
+    def _calculate_bdi(self, capesize_5tc: Optional[int], panamax_5tc: Optional[int], supramax_5tc: Optional[int]) -> Optional[float]:
         """
         Calculate BDI using the official formula:
         BDI = (0.40 × Capesize_5TC + 0.30 × Panamax_5TC + 0.30 × Supramax_5TC) × 0.1098
@@ -1250,12 +1288,12 @@ class BalticExchangeAPIClient:
             supramax_5tc: Supramax 5TC rate
             
         Returns:
-            Calculated BDI value
+            Calculated BDI value, or None if any component rate is missing
         """
-        try:
-            bdi = (0.40 * capesize_5tc + 0.30 * panamax_5tc + 0.30 * supramax_5tc) * 0.1098
-            logger.info(f"BDI calculation: ({0.40} × {capesize_5tc} + {0.30} × {panamax_5tc} + {0.30} × {supramax_5tc}) × {0.1098} = {bdi}")
-            return round(bdi, 2)
-        except Exception as e:
-            logger.error(f"Error calculating BDI: {e}")
+        if capesize_5tc is None or panamax_5tc is None or supramax_5tc is None:
+            logger.warning("Cannot calculate BDI without all three 5TC rates")
             return None
+        
+        bdi = round((0.40 * capesize_5tc + 0.30 * panamax_5tc + 0.30 * supramax_5tc) * 0.1098, 2)
+        logger.debug("BDI calculation: cape=%s pmx=%s smx=%s -> %.2f", capesize_5tc, panamax_5tc, supramax_5tc, bdi)
+        return bdi
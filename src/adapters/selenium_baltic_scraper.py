@@ -3,9 +3,11 @@ Selenium-based Baltic Exchange Scraper
 Alternative approach using browser automation to bypass bot protection.
 """
 
+import copy
 import logging
+import re
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 from datetime import datetime
 
 try:
@@ -22,8 +24,73 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Baltic Dry Index patterns, tried in priority order against lowercased text. Case-sensitive
+# patterns keep re's literal-prefix scan, which IGNORECASE disables
+_BDI_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'bdi[:\s]*([0-9,]+)',
+    r'baltic\s+dry\s+index[:\s]*([0-9,]+)',
+    r'([0-9,]+)\s*bdi',
+    r'bdi\s*=\s*([0-9,]+)',
+))
+
+# Index change patterns (absolute change with percentage, then percentage only), tried in priority order
+_CHANGE_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'([+-]?\d+(?:\.\d+)?)\s*\(([+-]?\d+(?:\.\d+)?)%\)',
+    r'([+-]?\d+(?:\.\d+)?)\s*%',
+))
+
+# P5/5TC summary value patterns, tried in priority order against lowercased text
+_P5_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'5tc[:\s]*([0-9,]+)',
+    r'p5[:\s]*([0-9,]+)',
+))
+
+# Vessel class rates in lowercased text, one literal-led pattern per class: re scans for a literal
+# prefix far faster than it tries an alternation at every position
+_VESSEL_PATTERNS = tuple((vessel_type, re.compile(vessel_type + r'[:\s]*([0-9,]+)'))
+                         for vessel_type in ('capesize', 'panamax', 'supramax', 'handysize'))
+
+# Chrome arguments added to every driver: avoid automation detection, present a desktop user agent,
+# and skip GPU setup since only the page text is used
+_CHROME_ARGS = (
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-blink-features=AutomationControlled',
+    '--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+    '--disable-gpu',
+)
+
+# Hides the navigator.webdriver flag that automation sets
+_HIDE_WEBDRIVER_JS = "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"
+
+# Rendered text of the page body, read in the browser instead of through WebDriver's element text atom
+_BODY_TEXT_JS = "return document.body.innerText"
+
+# Longest wait for the roundup text to render after the page is loaded
+_CONTENT_WAIT_SECONDS = 5
+
+# Lowercased words whose presence means the market content has rendered
+_CONTENT_MARKERS = ('bdi', 'capesize', 'panamax', 'supramax', 'handysize')
+
+# Market sentiment words, tried in priority order against lowercased text
+_SENTIMENT_PATTERNS = tuple(re.compile(pattern) for pattern in (
+    r'(bullish|bearish|neutral|positive|negative)',
+    r'(strengthening|weakening|stable|volatile)',
+    r'(up|down|flat|steady)',
+))
+
+def _is_challenge_title(page_title: str) -> bool:
+    """Whether a page title belongs to the bot-protection challenge page."""
+    page_title = page_title.lower()
+    return "challenge" in page_title or "validation" in page_title
+
 class SeleniumBalticScraper:
-    """Selenium-based scraper for Baltic Exchange data."""
+    """
+    Selenium-based scraper for Baltic Exchange data.
+    
+    The Chrome driver is started on first use and kept open between calls, so call
+    close() when done or use the scraper as a context manager.
+    """
     
     def __init__(self, headless: bool = True, timeout: int = 30):
         """Initialize Selenium scraper."""
@@ -33,11 +100,28 @@ class SeleniumBalticScraper:
         self.headless = headless
         self.timeout = timeout
         self.driver = None
+        # Page text of the last scrape and what was extracted from it
+        self._last_extraction: Optional[Tuple[str, Dict]] = None
         self.base_url = "https://www.balticexchange.com"
         self.weekly_roundup_url = "/en/data-services/WeeklyRoundup.html"
         
         logger.info("Selenium Baltic Exchange scraper initialized")
     
+    def __enter__(self) -> "SeleniumBalticScraper":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Quit the Chrome driver if one is running."""
+        if self.driver:
+            try:
+                self.driver.quit()
+            except WebDriverException as e:
+                logger.warning(f"Error closing Chrome driver: {e}")
+            self.driver = None
+    
     def _setup_driver(self):
         """Set up Chrome driver with appropriate options."""
         options = Options()
@@ -45,21 +129,23 @@ class SeleniumBalticScraper:
         if self.headless:
             options.add_argument('--headless')
         
+        for argument in _CHROME_ARGS:
+            options.add_argument(argument)
+        
         # Additional options to avoid detection
-        options.add_argument('--no-sandbox')
-        options.add_argument('--disable-dev-shm-usage')
-        options.add_argument('--disable-blink-features=AutomationControlled')
         options.add_experimental_option("excludeSwitches", ["enable-automation"])
         options.add_experimental_option('useAutomationExtension', False)
         
-        # Set user agent
-        options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+        # Only the page text is used: skip image downloads, and hand control back at
+        # DOMContentLoaded instead of waiting for late ads and analytics
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.page_load_strategy = 'eager'
         
         try:
             driver = webdriver.Chrome(options=options)
             
             # Execute script to remove webdriver property
-            driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+            driver.execute_script(_HIDE_WEBDRIVER_JS)
             
             return driver
         except WebDriverException as e:
@@ -72,10 +158,14 @@ class SeleniumBalticScraper:
         Get market data using Selenium browser automation.
         
         Returns:
-            Dictionary with market data or error information
+            Dictionary with market data or error information; results are stamped with the time
+            the page was read, errors with the time the scrape started
         """
+        scraped_at = datetime.now().isoformat()
         try:
-            self.driver = self._setup_driver()
+            # Chrome start-up dominates a scrape, so reuse the running driver
+            if self.driver is None:
+                self.driver = self._setup_driver()
             url = f"{self.base_url}{self.weekly_roundup_url}"
             
             logger.info(f"Navigating to: {url}")
@@ -87,19 +177,27 @@ class SeleniumBalticScraper:
             # Wait for body element to be present
             wait.until(EC.presence_of_element_located((By.TAG_NAME, "body")))
             
-            # Additional wait for content to load
-            time.sleep(5)
+            # Wait for the roundup text to render instead of sleeping a fixed time. A challenge page
+            # gets the same time to solve itself and redirect; after the old delay, carry on with
+            # whatever is showing and let the title check below catch a challenge that stayed
+            try:
+                WebDriverWait(self.driver, _CONTENT_WAIT_SECONDS).until(self._content_ready)
+            except TimeoutException:
+                logger.info("Market content not detected, continuing with the rendered page")
+            
+            # Starting Chrome and loading the page can take a while, so restamp once it has rendered
+            scraped_at = datetime.now().isoformat()
             
             # Check if we're still on a challenge page
             page_title = self.driver.title
             logger.info(f"Page title: {page_title}")
             
-            if "challenge" in page_title.lower() or "validation" in page_title.lower():
+            if _is_challenge_title(page_title):
                 logger.warning("Still on challenge page after Selenium navigation")
-                return self._handle_challenge_page()
+                return self._handle_challenge_page(scraped_at)
             
             # Extract data from the rendered page
-            market_data = self._extract_market_data()
+            market_data = self._extract_market_data(scraped_at)
             
             logger.info("Successfully extracted market data using Selenium")
             return market_data
@@ -109,33 +207,37 @@ class SeleniumBalticScraper:
             return {
                 "status": "timeout",
                 "message": "Page load timeout",
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
         except WebDriverException as e:
             logger.error(f"WebDriver error: {e}")
+            # The browser may have died; start a fresh one on the next call
+            self.close()
             return {
                 "status": "webdriver_error",
                 "message": str(e),
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
         except Exception as e:
             logger.error(f"Unexpected error: {e}")
             return {
                 "status": "error",
                 "message": str(e),
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
-        finally:
-            if self.driver:
-                self.driver.quit()
-                self.driver = None
     
-    def _handle_challenge_page(self) -> Dict:
+    @staticmethod
+    def _content_ready(driver) -> bool:
+        """Whether the market text has rendered."""
+        page_text = (driver.execute_script(_BODY_TEXT_JS) or "").lower()
+        return any(marker in page_text for marker in _CONTENT_MARKERS)
+    
+    def _handle_challenge_page(self, scraped_at: Optional[str] = None) -> Dict:
         """Handle challenge page detection."""
         return {
             "status": "challenge_detected",
             "message": "Bot protection challenge still active with Selenium",
-            "scraped_at": datetime.now().isoformat(),
+            "scraped_at": scraped_at or datetime.now().isoformat(),
             "recommendations": [
                 "Selenium approach also blocked by anti-bot protection",
                 "Consider using official API access",
@@ -144,25 +246,23 @@ class SeleniumBalticScraper:
             ]
         }
     
-    def _extract_market_data(self) -> Dict:
+    def _extract_market_data(self, scraped_at: Optional[str] = None) -> Dict:
         """Extract market data from the rendered page."""
+        scraped_at = scraped_at or datetime.now().isoformat()
         try:
-            # Get page source after JavaScript execution
-            page_source = self.driver.page_source
-            page_text = self.driver.find_element(By.TAG_NAME, "body").text
+            # Read the rendered text in one script call; the serialized page source isn't needed
+            page_text = self.driver.execute_script(_BODY_TEXT_JS) or ""
             
             logger.info(f"Page text length: {len(page_text)}")
             logger.info(f"First 500 characters: {page_text[:500]}")
             
-            # Extract data using the same patterns as the regular scraper
+            extracted = self._extract_page_text(page_text)
+            
             market_data = {
-                "scraped_at": datetime.now().isoformat(),
+                "scraped_at": scraped_at,
                 "source_url": f"{self.base_url}{self.weekly_roundup_url}",
                 "method": "selenium",
-                "bdi": self._extract_bdi_data(page_text),
-                "p5": self._extract_p5_data(page_text),
-                "bulk_rates": self._extract_bulk_rates_data(page_text),
-                "market_summary": self._extract_market_summary(page_text),
+                **extracted,
                 "raw_content": {
                     "page_title": self.driver.title,
                     "text_length": len(page_text),
@@ -177,13 +277,32 @@ class SeleniumBalticScraper:
             return {
                 "status": "extraction_error",
                 "message": str(e),
-                "scraped_at": datetime.now().isoformat()
+                "scraped_at": scraped_at
             }
     
-    def _extract_bdi_data(self, page_text: str) -> Dict:
-        """Extract BDI data from page text."""
-        import re
+    def _extract_page_text(self, page_text: str) -> Dict:
+        """Run the extractors over the page text, reusing the last results if the text is unchanged."""
+        if self._last_extraction is not None and self._last_extraction[0] == page_text:
+            logger.info("Page text unchanged since last scrape, reusing extracted data")
+            return copy.deepcopy(self._last_extraction[1])
+        
+        # Every extractor matches case-sensitive patterns against one lowercased copy
+        text_lower = page_text.lower()
+        
+        # Extract data using the same patterns as the regular scraper
+        extracted = {
+            "bdi": self._extract_bdi_data(text_lower),
+            "p5": self._extract_p5_data(text_lower),
+            "bulk_rates": self._extract_bulk_rates_data(text_lower),
+            "market_summary": self._extract_market_summary(text_lower)
+        }
         
+        # Keep a private copy so callers can modify what they get back
+        self._last_extraction = (page_text, copy.deepcopy(extracted))
+        return extracted
+    
+    def _extract_bdi_data(self, page_text: str) -> Dict:
+        """Extract BDI data from lowercased page text."""
         bdi_data = {
             "current_value": None,
             "change": None,
@@ -193,27 +312,15 @@ class SeleniumBalticScraper:
         
         try:
             # BDI patterns
-            bdi_patterns = [
-                r'BDI[:\s]*([0-9,]+)',
-                r'Baltic\s+Dry\s+Index[:\s]*([0-9,]+)',
-                r'([0-9,]+)\s*BDI',
-                r'BDI\s*=\s*([0-9,]+)',
-            ]
-            
-            for pattern in bdi_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for pattern in _BDI_PATTERNS:
+                match = pattern.search(page_text)
                 if match:
                     bdi_data["current_value"] = int(match.group(1).replace(',', ''))
                     break
             
             # Change patterns
-            change_patterns = [
-                r'([+-]?\d+(?:\.\d+)?)\s*\(([+-]?\d+(?:\.\d+)?)%\)',
-                r'([+-]?\d+(?:\.\d+)?)\s*%',
-            ]
-            
-            for pattern in change_patterns:
-                match = re.search(pattern, page_text)
+            for pattern in _CHANGE_PATTERNS:
+                match = pattern.search(page_text)
                 if match:
                     if len(match.groups()) == 2:
                         bdi_data["change"] = float(match.group(1))
@@ -228,9 +335,7 @@ class SeleniumBalticScraper:
         return bdi_data
     
     def _extract_p5_data(self, page_text: str) -> Dict:
-        """Extract P5 data from page text."""
-        import re
-        
+        """Extract P5 data from lowercased page text."""
         p5_data = {
             "routes": {},
             "summary": {}
@@ -238,13 +343,8 @@ class SeleniumBalticScraper:
         
         try:
             # P5 patterns
-            p5_patterns = [
-                r'5TC[:\s]*([0-9,]+)',
-                r'P5[:\s]*([0-9,]+)',
-            ]
-            
-            for pattern in p5_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for pattern in _P5_PATTERNS:
+                match = pattern.search(page_text)
                 if match:
                     p5_data["summary"]["value"] = int(match.group(1).replace(',', ''))
                     break
@@ -255,9 +355,7 @@ class SeleniumBalticScraper:
         return p5_data
     
     def _extract_bulk_rates_data(self, page_text: str) -> Dict:
-        """Extract bulk rates data from page text."""
-        import re
-        
+        """Extract bulk rates data from lowercased page text."""
         bulk_rates = {
             "capesize": {},
             "panamax": {},
@@ -266,17 +364,14 @@ class SeleniumBalticScraper:
         }
         
         try:
-            # Vessel type patterns
-            vessel_patterns = [
-                r'(Capesize|Panamax|Supramax|Handysize)[:\s]*([0-9,]+)',
-            ]
-            
-            for pattern in vessel_patterns:
-                matches = re.findall(pattern, page_text, re.IGNORECASE)
-                for vessel_type, value in matches:
-                    vessel_type = vessel_type.lower()
-                    if vessel_type in bulk_rates:
-                        bulk_rates[vessel_type]["rate"] = int(value.replace(',', ''))
+            # Vessel type patterns, applied in page order so the last mention of each class wins
+            matches = sorted(
+                (match.start(), vessel_type, match.group(1))
+                for vessel_type, pattern in _VESSEL_PATTERNS
+                for match in pattern.finditer(page_text)
+            )
+            for _, vessel_type, value in matches:
+                bulk_rates[vessel_type]["rate"] = int(value.replace(',', ''))
             
         except Exception as e:
             logger.error(f"Error extracting bulk rates data: {e}")
@@ -284,9 +379,7 @@ class SeleniumBalticScraper:
         return bulk_rates
     
     def _extract_market_summary(self, page_text: str) -> Dict:
-        """Extract market summary from page text."""
-        import re
-        
+        """Extract market summary from lowercased page text."""
         summary = {
             "market_sentiment": None,
             "key_highlights": [],
@@ -295,16 +388,10 @@ class SeleniumBalticScraper:
         
         try:
             # Sentiment patterns
-            sentiment_patterns = [
-                r'(bullish|bearish|neutral|positive|negative)',
-                r'(strengthening|weakening|stable|volatile)',
-                r'(up|down|flat|steady)',
-            ]
-            
-            for pattern in sentiment_patterns:
-                match = re.search(pattern, page_text, re.IGNORECASE)
+            for pattern in _SENTIMENT_PATTERNS:
+                match = pattern.search(page_text)
                 if match:
-                    summary["market_sentiment"] = match.group(1).lower()
+                    summary["market_sentiment"] = match.group(1)
                     break
             
         except Exception as e:
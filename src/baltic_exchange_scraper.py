@@ -3,37 +3,45 @@ Baltic Exchange Weekly Market Roundup Scraper
 Main orchestration logic for scraping and processing Baltic Exchange market data.
 """
 
+import copy
+import csv
+import io
 import json
 import logging
+import operator
 import os
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import time
 
-try:
-    from .adapters.baltic_exchange_api import BalticExchangeAPIClient
-except ImportError:
-    # Fallback for direct execution
-    from adapters.baltic_exchange_api import BalticExchangeAPIClient
+import orjson
+
+from .adapters.baltic_exchange_api import BalticExchangeAPIClient
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+VESSEL_TYPES = ('capesize', 'panamax', 'supramax', 'handysize')
+
+# Fields identifying a weekly report across scrapes
+REPORT_ID_FIELDS = ('week_number', 'date_report', 'category')
+_get_report_id_fields = operator.itemgetter(*REPORT_ID_FIELDS)
+
 class BalticExchangeScraper:
     """Main scraper orchestration class for Baltic Exchange market data."""
     
     def __init__(self, data_dir: str = None):
         """Initialize the scraper with data directory and components."""
         
-        # Initialize components
-        self.api_client = BalticExchangeAPIClient()
-        
         # File paths
         self.data_dir = Path(data_dir) if data_dir else Path("data")
         self.data_dir.mkdir(exist_ok=True)
         
+        # Initialize components
+        self.api_client = BalticExchangeAPIClient(cache_dir=str(self.data_dir))
+        
         self.market_data_file = self.data_dir / "market_data.json"
         self.state_file = self.data_dir / "state.json"
         
@@ -41,6 +49,9 @@ class BalticExchangeScraper:
         self.market_data = self._load_market_data()
         self.state = self._load_state()
         
+        # (cache key, statistics) from the last get_statistics() call
+        self._statistics_cache: Optional[Tuple[Tuple, Dict]] = None
+        
         logger.info(f"Baltic Exchange Scraper initialized. Data directory: {self.data_dir}")
         logger.info(f"Loaded {len(self.market_data)} existing market data entries")
     
@@ -108,6 +119,15 @@ class BalticExchangeScraper:
         except Exception as e:
             logger.error(f"Error saving state: {e}")
     
+    @staticmethod
+    def _report_id(report: Dict) -> Tuple:
+        """Return the (week_number, date_report, category) identity of a weekly report."""
+        try:
+            return _get_report_id_fields(report)
+        except KeyError:
+            # Reports missing an identity field fall back to empty strings
+            return tuple(report.get(field, '') for field in REPORT_ID_FIELDS)
+    
     def _deduplicate_market_data(self, market_data: List[Dict]) -> List[Dict]:
         """Remove duplicate market data based on weekly report content."""
         unique_data = []
@@ -123,8 +143,8 @@ class BalticExchangeScraper:
             # Check if this entry has any new weekly reports
             new_reports = []
             for report in weekly_reports:
-                # Create unique identifier: week_number + date_report + category
-                report_id = f"{report.get('week_number', '')}_{report.get('date_report', '')}_{report.get('category', '')}"
+                # Unique identifier: (week_number, date_report, category)
+                report_id = self._report_id(report)
                 
                 if report_id not in seen_weekly_reports:
                     seen_weekly_reports.add(report_id)
@@ -155,15 +175,12 @@ class BalticExchangeScraper:
         new_reports = new_data.get('weekly_reports', [])
         
         # Create set of existing report IDs
-        existing_report_ids = set()
-        for report in existing_reports:
-            report_id = f"{report.get('week_number', '')}_{report.get('date_report', '')}_{report.get('category', '')}"
-            existing_report_ids.add(report_id)
+        existing_report_ids = {self._report_id(report) for report in existing_reports}
         
         # Add only new reports
         merged_reports = existing_reports.copy()
         for report in new_reports:
-            report_id = f"{report.get('week_number', '')}_{report.get('date_report', '')}_{report.get('category', '')}"
+            report_id = self._report_id(report)
             if report_id not in existing_report_ids:
                 merged_reports.append(report)
                 logger.info(f"Added new weekly report: {report_id}")
@@ -230,8 +247,20 @@ class BalticExchangeScraper:
             
             logger.info("Starting market data update from Baltic Exchange...")
             
-            # Fetch new data from API
-            new_market_data = self.api_client.get_weekly_roundup_data()
+            # Fetch new data from API (a non-forced update stops early if the listing is unchanged,
+            # unless there is no stored data yet to keep)
+            new_market_data = self.api_client.get_weekly_roundup_data(
+                skip_if_unchanged=not force_update and bool(self.market_data)
+            )
+            
+            if new_market_data.get('status') == 'not_modified':
+                logger.info("Skipping update - weekly reports listing unchanged")
+                return {
+                    "status": "skipped",
+                    "message": "Weekly reports listing unchanged, skipping update",
+                    "last_update": self.state.get('last_update'),
+                    "total_entries": len(self.market_data)
+                }
             
             if not new_market_data:
                 logger.warning("No market data received from API")
@@ -339,7 +368,7 @@ class BalticExchangeScraper:
             
             # Update bulk rates history
             bulk_rates = new_data.get('bulk_rates', {})
-            if any(bulk_rates.get(vt, {}).get('rate') for vt in ['capesize', 'panamax', 'supramax', 'handysize']):
+            if any(bulk_rates.get(vt, {}).get('rate') for vt in VESSEL_TYPES):
                 rates_entry = {
                     'timestamp': new_data['scraped_at'],
                     'capesize': bulk_rates.get('capesize', {}).get('rate'),
@@ -370,31 +399,51 @@ class BalticExchangeScraper:
             return self.market_data
         
         filtered_data = []
+        prepared_filters = self._prepare_filters(filters)
         
         for entry in self.market_data:
             # Apply filters
-            if self._matches_filters(entry, filters):
+            if self._matches_filters(entry, prepared_filters):
                 filtered_data.append(entry)
         
         logger.info(f"Filtered {len(self.market_data)} entries -> {len(filtered_data)} results")
         return filtered_data
     
+    def count_weekly_reports(self) -> int:
+        """Count weekly reports across all stored market data entries."""
+        return sum(len(entry.get('weekly_reports') or ()) for entry in self.market_data)
+    
+    def _prepare_filters(self, filters: Dict) -> Dict:
+        """Parse date filters once so they are not re-parsed for every entry."""
+        prepared = dict(filters)
+        
+        for key in ('start_date', 'end_date'):
+            value = prepared.get(key)
+            if value and not isinstance(value, datetime):
+                try:
+                    prepared[key] = datetime.fromisoformat(value)
+                except (ValueError, TypeError):
+                    # Unparseable dates are ignored, as before
+                    prepared[key] = None
+        
+        return prepared
+    
     def _matches_filters(self, entry: Dict, filters: Dict) -> bool:
-        """Check if market data entry matches all specified filters."""
+        """Check if market data entry matches all specified (prepared) filters."""
         
         # Date range filter
-        if 'start_date' in filters and filters['start_date']:
+        start_date = filters.get('start_date')
+        if start_date:
             try:
-                start_date = datetime.fromisoformat(filters['start_date'])
                 entry_date = datetime.fromisoformat(entry.get('scraped_at', '1900-01-01'))
                 if entry_date < start_date:
                     return False
             except (ValueError, TypeError):
                 pass
         
-        if 'end_date' in filters and filters['end_date']:
+        end_date = filters.get('end_date')
+        if end_date:
             try:
-                end_date = datetime.fromisoformat(filters['end_date'])
                 entry_date = datetime.fromisoformat(entry.get('scraped_at', '2100-01-01'))
                 if entry_date > end_date:
                     return False
@@ -429,27 +478,28 @@ class BalticExchangeScraper:
         if not self.market_data:
             return {}
         
-        # Sort by scraped_at timestamp and get the latest
-        sorted_data = sorted(self.market_data, key=lambda x: x.get('scraped_at', ''), reverse=True)
-        return sorted_data[0] if sorted_data else {}
+        # Pick the entry with the newest scraped_at timestamp (first one wins on ties)
+        return max(self.market_data, key=lambda x: x.get('scraped_at', ''))
     
     def get_bdi_trend(self, days: int = 30) -> Dict:
         """Get BDI trend data for the specified number of days."""
         if not self.state.get('bdi_history'):
             return {"trend": "insufficient_data", "data_points": 0}
         
-        # Filter history to requested time period
+        # Walk the history once, counting recent entries and collecting their values
         cutoff_time = datetime.now() - timedelta(days=days)
-        recent_data = [
-            entry for entry in self.state['bdi_history']
-            if datetime.fromisoformat(entry['timestamp']) > cutoff_time
-        ]
+        recent_count = 0
+        values = []
+        for entry in self.state['bdi_history']:
+            if datetime.fromisoformat(entry['timestamp']) > cutoff_time:
+                recent_count += 1
+                if entry.get('value'):
+                    values.append(entry['value'])
         
-        if len(recent_data) < 2:
-            return {"trend": "insufficient_data", "data_points": len(recent_data)}
+        if recent_count < 2:
+            return {"trend": "insufficient_data", "data_points": recent_count}
         
         # Calculate trend
-        values = [entry['value'] for entry in recent_data if entry.get('value')]
         if len(values) < 2:
             return {"trend": "insufficient_data", "data_points": len(values)}
         
@@ -468,7 +518,20 @@ class BalticExchangeScraper:
         }
     
     def get_statistics(self) -> Dict:
-        """Get statistics about the market data."""
+        """Get statistics about the market data, reusing the last result until the data changes."""
+        cache_key = (
+            len(self.market_data),
+            self.state.get("last_update"),
+            self.state.get("update_count", 0)
+        )
+        if not self._statistics_cache or self._statistics_cache[0] != cache_key:
+            self._statistics_cache = (cache_key, self._compute_statistics())
+        
+        # Hand out a copy so callers can't alter the cached result
+        return copy.deepcopy(self._statistics_cache[1])
+    
+    def _compute_statistics(self) -> Dict:
+        """Compute statistics about the market data."""
         if not self.market_data:
             return {
                 "total_entries": 0,
@@ -479,77 +542,80 @@ class BalticExchangeScraper:
                 "bulk_rates_summary": {}
             }
         
+        # Collect every metric in a single pass over the entries
+        complete_bdi = complete_p5 = complete_bulk_rates = 0
+        bdi_values = []
+        p5_values = []
+        vessel_rates = {vessel_type: [] for vessel_type in VESSEL_TYPES}
+        
+        for entry in self.market_data:
+            data_quality = entry.get('data_quality', {})
+            if data_quality.get('bdi_complete'):
+                complete_bdi += 1
+            if data_quality.get('p5_complete'):
+                complete_p5 += 1
+            if data_quality.get('bulk_rates_complete'):
+                complete_bulk_rates += 1
+            
+            bdi_value = entry.get('bdi', {}).get('current_value')
+            if bdi_value:
+                bdi_values.append(bdi_value)
+            
+            p5_value = entry.get('p5', {}).get('summary', {}).get('value')
+            if p5_value:
+                p5_values.append(p5_value)
+            
+            bulk_rates = entry.get('bulk_rates', {})
+            for vessel_type, rates in vessel_rates.items():
+                rate = bulk_rates.get(vessel_type, {}).get('rate')
+                if rate:
+                    rates.append(rate)
+        
         # Data quality summary
         quality_summary = {
             "total_entries": len(self.market_data),
-            "complete_bdi": sum(1 for e in self.market_data if e.get('data_quality', {}).get('bdi_complete')),
-            "complete_p5": sum(1 for e in self.market_data if e.get('data_quality', {}).get('p5_complete')),
-            "complete_bulk_rates": sum(1 for e in self.market_data if e.get('data_quality', {}).get('bulk_rates_complete'))
-        }
-        
-        # BDI summary
-        bdi_values = [e.get('bdi', {}).get('current_value') for e in self.market_data if e.get('bdi', {}).get('current_value')]
-        bdi_summary = {
-            "current": bdi_values[-1] if bdi_values else None,
-            "min": min(bdi_values) if bdi_values else None,
-            "max": max(bdi_values) if bdi_values else None,
-            "average": sum(bdi_values) / len(bdi_values) if bdi_values else None
-        }
-        
-        # P5 summary
-        p5_values = [e.get('p5', {}).get('summary', {}).get('value') for e in self.market_data if e.get('p5', {}).get('summary', {}).get('value')]
-        p5_summary = {
-            "current": p5_values[-1] if p5_values else None,
-            "min": min(p5_values) if p5_values else None,
-            "max": max(p5_values) if p5_values else None,
-            "average": sum(p5_values) / len(p5_values) if p5_values else None
+            "complete_bdi": complete_bdi,
+            "complete_p5": complete_p5,
+            "complete_bulk_rates": complete_bulk_rates
         }
         
         # Bulk rates summary
-        bulk_rates_summary = {}
-        for vessel_type in ['capesize', 'panamax', 'supramax', 'handysize']:
-            rates = [e.get('bulk_rates', {}).get(vessel_type, {}).get('rate') for e in self.market_data if e.get('bulk_rates', {}).get(vessel_type, {}).get('rate')]
-            if rates:
-                bulk_rates_summary[vessel_type] = {
-                    "current": rates[-1],
-                    "min": min(rates),
-                    "max": max(rates),
-                    "average": sum(rates) / len(rates)
-                }
+        bulk_rates_summary = {
+            vessel_type: self._summarize_values(rates)
+            for vessel_type, rates in vessel_rates.items() if rates
+        }
         
         return {
             "total_entries": len(self.market_data),
             "last_update": self.state.get("last_update"),
             "update_count": self.state.get("update_count", 0),
             "data_quality_summary": quality_summary,
-            "bdi_summary": bdi_summary,
-            "p5_summary": p5_summary,
+            "bdi_summary": self._summarize_values(bdi_values),
+            "p5_summary": self._summarize_values(p5_values),
             "bulk_rates_summary": bulk_rates_summary
         }
     
-    def export_csv(self, filters: Dict = None) -> str:
-        """Export market data to CSV format."""
-        import csv
-        import io
-        
-        data = self.get_market_data(filters)
-        
-        if not data:
-            return ""
-        
-        # Create CSV
-        output = io.StringIO()
-        writer = csv.writer(output)
+    @staticmethod
+    def _summarize_values(values: List) -> Dict:
+        """Summarize a series of values as current/min/max/average."""
+        if not values:
+            return {"current": None, "min": None, "max": None, "average": None}
         
-        # Write header
-        headers = [
+        return {
+            "current": values[-1],
+            "min": min(values),
+            "max": max(values),
+            "average": sum(values) / len(values)
+        }
+    
+    def _iter_csv_rows(self, data: List[Dict]):
+        """Yield the CSV header followed by one row per market data entry."""
+        yield [
             'Scraped At', 'BDI Value', 'BDI Change', 'BDI Change %', 'P5 Value',
             'Capesize Rate', 'Panamax Rate', 'Supramax Rate', 'Handysize Rate',
             'Market Sentiment', 'Data Quality Score'
         ]
-        writer.writerow(headers)
         
-        # Write data
         for entry in data:
             bdi = entry.get('bdi', {})
             p5 = entry.get('p5', {})
@@ -564,7 +630,7 @@ class BalticExchangeScraper:
                 1 if data_quality.get('bulk_rates_complete') else 0
             ])
             
-            row = [
+            yield [
                 entry.get('scraped_at', ''),
                 bdi.get('current_value', ''),
                 bdi.get('change', ''),
@@ -577,10 +643,68 @@ class BalticExchangeScraper:
                 market_summary.get('market_sentiment', ''),
                 quality_score
             ]
-            writer.writerow(row)
+    
+    def export_csv(self, filters: Dict = None) -> str:
+        """Export market data to CSV format."""
+        data = self.get_market_data(filters)
+        
+        if not data:
+            return ""
+        
+        # Create CSV
+        output = io.StringIO()
+        writer = csv.writer(output)
+        writer.writerows(self._iter_csv_rows(data))
         
         return output.getvalue()
     
+    def export_csv_to(self, path, filters: Dict = None) -> int:
+        """
+        Stream market data as CSV directly to a file.
+        
+        Args:
+            path: Output CSV file path
+            filters: Dictionary with filter options
+            
+        Returns:
+            Number of data rows written (0 if there was no data and no file was created)
+        """
+        data = self.get_market_data(filters)
+        
+        if not data:
+            return 0
+        
+        rows_written = 0
+        with open(path, 'w', encoding='utf-8', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f)
+            for row in self._iter_csv_rows(data):
+                writer.writerow(row)
+                rows_written += 1
+        
+        # Header row is not a data row
+        return rows_written - 1
+    
+    def export_ndjson(self, path, filters: Dict = None) -> int:
+        """
+        Export market data as newline-delimited JSON, one entry per line.
+        
+        Args:
+            path: Output NDJSON file path
+            filters: Dictionary with filter options
+            
+        Returns:
+            Number of entries written (0 if there was no data and no file was created)
+        """
+        data = self.get_market_data(filters)
+        
+        if not data:
+            return 0
+        
+        with open(path, 'wb') as f:
+            f.writelines(orjson.dumps(entry, default=str) + b"\n" for entry in data)
+        
+        return len(data)
+    
     def test_connection(self) -> Dict:
         """Test connection to Baltic Exchange."""
         return self.api_client.test_connection()
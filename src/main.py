@@ -3,32 +3,26 @@ Baltic Exchange Scraper - FastAPI Application
 Main web application for the Baltic Exchange market monitoring system.
 """
 
-import json
 import logging
 import os
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, List
+from typing import Optional, Dict, List, Tuple
 
-from fastapi import FastAPI, Query, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse, JSONResponse
+import orjson
+from fastapi import APIRouter, FastAPI, Query, HTTPException, Request
+from fastapi.responses import HTMLResponse, ORJSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 
-try:
-    from .baltic_exchange_scraper import BalticExchangeScraper
-    from .adapters.baltic_exchange_api import BalticExchangeAPIClient
-except ImportError:
-    # Fallback for direct execution
-    from baltic_exchange_scraper import BalticExchangeScraper
-    from adapters.baltic_exchange_api import BalticExchangeAPIClient
+from .baltic_exchange_scraper import BalticExchangeScraper
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Suppress verbose logs from adapters to reduce noise
-logging.getLogger("adapters.baltic_exchange_api").setLevel(logging.WARNING)
+logging.getLogger(f"{__package__}.adapters.baltic_exchange_api").setLevel(logging.WARNING)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -36,40 +30,172 @@ app = FastAPI(
     description="API for scraping and analyzing Baltic Exchange weekly market data",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=ORJSONResponse
 )
 
+class SimpleCORSMiddleware:
+    """Minimal ASGI middleware applying an allow-all CORS policy without per-request origin matching."""
+    
+    CORS_HEADERS = [
+        (b"access-control-allow-origin", b"*"),
+        (b"access-control-allow-methods", b"GET, POST, OPTIONS"),
+    ]
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        
+        # Answer preflight requests directly, echoing the requested headers
+        if scope["method"] == "OPTIONS":
+            request_headers = dict(scope["headers"])
+            if b"access-control-request-method" in request_headers:
+                allow_headers = request_headers.get(b"access-control-request-headers", b"Content-Type")
+                await send({
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [
+                        *self.CORS_HEADERS,
+                        (b"access-control-allow-headers", allow_headers),
+                        (b"content-length", b"0"),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": b""})
+                return
+        
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), *self.CORS_HEADERS]
+            await send(message)
+        
+        await self.app(scope, receive, send_with_cors)
+
+# Short-lived in-process cache for near-static GET endpoints: path -> (TTL seconds, seconds past the
+# TTL a cached body may still be served when the handler fails). test-connection never serves stale
+# data, since a connectivity check must report upstream failures
+_RESPONSE_CACHE_TTL = {
+    "/api/health": (5.0, 60.0),
+    "/api/test-connection": (30.0, 0.0),
+}
+# path -> (stored at, body, raw header list)
+_response_cache: Dict[str, Tuple[float, bytes, List[Tuple[bytes, bytes]]]] = {}
+
+def _cached_response(cached: Tuple[float, bytes, List[Tuple[bytes, bytes]]]) -> Response:
+    """Rebuild a cached 200 response with its original headers, repeated ones included."""
+    response = Response(content=cached[1])
+    response.raw_headers = list(cached[2])
+    return response
+
+# Registered before the CORS middleware so CORS wraps it and cached responses get CORS headers too
+@app.middleware("http")
+async def cache_static_responses(request: Request, call_next):
+    """Serve cached response bodies for near-static endpoints, falling back to recent data on errors."""
+    path = request.url.path
+    limits = _RESPONSE_CACHE_TTL.get(path)
+    if limits is None or request.method != "GET":
+        return await call_next(request)
+    ttl, max_stale = limits
+    
+    now = time.monotonic()
+    cached = _response_cache.get(path)
+    if cached and now - cached[0] < ttl:
+        return _cached_response(cached)
+    # A cached body may stand in for a failed handler only until it is too old
+    fallback = cached if cached and now - cached[0] < ttl + max_stale else None
+    
+    try:
+        response = await call_next(request)
+    except Exception as e:
+        if fallback:
+            logger.warning("Serving stale %s after handler error: %s", path, e)
+            return _cached_response(fallback)
+        raise
+    
+    if response.status_code != 200:
+        if fallback:
+            logger.warning("Serving stale %s after status %s", path, response.status_code)
+            return _cached_response(fallback)
+        return response
+    
+    body = b"".join([chunk async for chunk in response.body_iterator])
+    _response_cache[path] = (now, body, list(response.raw_headers))
+    return _cached_response(_response_cache[path])
+
 # Add CORS middleware
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+app.add_middleware(SimpleCORSMiddleware)
+
+# Directory containing this module, resolved once for the data and web paths
+_SRC_DIR = Path(__file__).parent
 
 # Initialize scraper with correct data directory
-data_dir = Path(__file__).parent.parent / "data"
+data_dir = _SRC_DIR.parent / "data"
 scraper = BalticExchangeScraper(data_dir=str(data_dir))
-api_client = BalticExchangeAPIClient()
+
+# Parsed market_data.json, keyed on the file's (mtime, size) so edits invalidate it
+_market_data_cache: Optional[Tuple[Tuple[int, int], List[Dict]]] = None
+
+def _load_market_data(json_file_path: Path) -> List[Dict]:
+    """Return the parsed market data file, re-reading it only when it has changed."""
+    global _market_data_cache
+    
+    stat = json_file_path.stat()
+    cache_key = (stat.st_mtime_ns, stat.st_size)
+    if _market_data_cache and _market_data_cache[0] == cache_key:
+        return _market_data_cache[1]
+    
+    data = orjson.loads(json_file_path.read_bytes())
+    _market_data_cache = (cache_key, data)
+    return data
+
+# Hot-path endpoints live on their own router, registered ahead of all other routes
+fast_router = APIRouter(
+    prefix="/api",
+    default_response_class=ORJSONResponse,
+    include_in_schema=False
+)
+
+# Static part of the health payload; only the timestamp changes per request
+_HEALTH_PAYLOAD = {
+    "status": "healthy",
+    "service": "Baltic Exchange Scraper",
+    "platform": "FastAPI",
+    "version": "1.0.0",
+}
+
+@fast_router.get("/health")
+async def health_check():
+    """Health check endpoint."""
+    # orjson serializes datetime natively, so skip isoformat() and jsonable_encoder
+    return ORJSONResponse(content={**_HEALTH_PAYLOAD, "timestamp": datetime.now()})
+
+@fast_router.get("/test-connection")
+async def test_connection():
+    """Test connection to Baltic Exchange."""
+    try:
+        result = scraper.test_connection()
+        return {
+            "status": "success",
+            "connection_test": result
+        }
+    except Exception as e:
+        logger.error(f"Error testing connection: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+app.include_router(fast_router)
 
 # Mount static files
-web_dir = Path(__file__).parent / "web"
+web_dir = _SRC_DIR / "web"
 if web_dir.exists():
     app.mount("/static", StaticFiles(directory=str(web_dir)), name="static")
     print(f"Web directory mounted at /static: {web_dir}")
 else:
     print(f"Warning: Web directory not found: {web_dir}")
 
-@app.get("/", response_class=HTMLResponse)
-async def serve_dashboard():
-    """Serve the main dashboard HTML."""
-    html_file = web_dir / "index.html"
-    if html_file.exists():
-        with open(html_file, 'r', encoding='utf-8') as f:
-            return HTMLResponse(content=f.read())
-    else:
-        return HTMLResponse(content="""
+_FALLBACK_DASHBOARD_HTML = """
         <html>
             <head><title>Baltic Exchange Scraper</title></head>
             <body>
@@ -78,18 +204,25 @@ async def serve_dashboard():
                 <p><a href="/docs">API Documentation</a></p>
             </body>
         </html>
-        """)
+        """
 
-@app.get("/api/health")
-async def health_check():
-    """Health check endpoint."""
-    return {
-        "status": "healthy", 
-        "service": "Baltic Exchange Scraper", 
-        "platform": "FastAPI",
-        "version": "1.0.0",
-        "timestamp": datetime.now().isoformat()
-    }
+def _load_dashboard_html() -> bytes:
+    """Read the dashboard HTML once at import time and return it pre-encoded."""
+    html_file = web_dir / "index.html"
+    if html_file.exists():
+        return html_file.read_bytes()
+    return _FALLBACK_DASHBOARD_HTML.encode("utf-8")
+
+_DASHBOARD_HTML = _load_dashboard_html()
+
+@app.get("/", response_class=HTMLResponse)
+async def serve_dashboard():
+    """Serve the main dashboard HTML."""
+    return Response(
+        content=_DASHBOARD_HTML,
+        media_type="text/html",
+        headers={"Cache-Control": "public, max-age=3600"}
+    )
 
 @app.get("/api/dashboard-data")
 async def get_dashboard_data(
@@ -113,25 +246,24 @@ async def get_dashboard_data(
                 }
             }
         
-        # Read and parse JSON file
-        with open(json_file_path, 'r', encoding='utf-8') as f:
-            all_data = json.loads(f.read())
+        # Parsed data is reused until the file changes on disk
+        all_data = _load_market_data(json_file_path)
         
         # Apply date filtering if provided
         if start_date or end_date:
+            # Parse the query dates once rather than for every entry
+            start_dt = datetime.fromisoformat(start_date) if start_date else None
+            end_dt = datetime.fromisoformat(end_date) if end_date else None
+            
             filtered_data = []
             for entry in all_data:
                 entry_date = datetime.fromisoformat(entry['scraped_at'].replace('Z', '+00:00'))
                 
-                if start_date:
-                    start_dt = datetime.fromisoformat(start_date)
-                    if entry_date < start_dt:
-                        continue
+                if start_dt and entry_date < start_dt:
+                    continue
                 
-                if end_date:
-                    end_dt = datetime.fromisoformat(end_date)
-                    if entry_date > end_dt:
-                        continue
+                if end_dt and entry_date > end_dt:
+                    continue
                 
                 filtered_data.append(entry)
         else:
@@ -211,12 +343,11 @@ async def export_csv():
     try:
         csv_data = scraper.export_csv()
         if csv_data:
-            return JSONResponse(
-                content={"status": "success", "csv_data": csv_data},
-                media_type="application/json"
+            return ORJSONResponse(
+                content={"status": "success", "csv_data": csv_data}
             )
         else:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={"status": "error", "message": "No data available for export"},
                 status_code=404
             )
@@ -224,19 +355,6 @@ async def export_csv():
         logger.error(f"Error exporting CSV: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/api/test-connection")
-async def test_connection():
-    """Test connection to Baltic Exchange."""
-    try:
-        result = scraper.test_connection()
-        return {
-            "status": "success",
-            "connection_test": result
-        }
-    except Exception as e:
-        logger.error(f"Error testing connection: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
-
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -7,14 +7,10 @@ Tests the scraper functionality and data extraction.
 import sys
 import json
 import logging
-from pathlib import Path
 from datetime import datetime
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent / "src"))
-
-from baltic_exchange_scraper import BalticExchangeScraper
-from adapters.baltic_exchange_api import BalticExchangeAPIClient
+from src.baltic_exchange_scraper import BalticExchangeScraper
+from src.adapters.baltic_exchange_api import BalticExchangeAPIClient
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
@@ -152,8 +148,7 @@ def test_scraper():
                 csv_data = scraper.export_csv()
                 if csv_data:
                     print("✓ CSV export successful")
-                    lines = csv_data.splitlines()
-                    print(f"CSV contains {len(lines)} lines")
+                    print(f"CSV contains {csv_data.count(chr(10))} lines")
                     
                     # Save CSV for inspection
                     csv_file = "test_market_data.csv"
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the on-disk caches of the Baltic Exchange API client:
+the conditional-GET cache of the reports listing and the report text cache.
+"""
+
+import logging
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import orjson
+import requests
+
+from src.adapters.baltic_exchange_api import BalticExchangeAPIClient
+
+logging.disable(logging.CRITICAL)
+
+REPORT_URL = "https://www.balticexchange.com/en/data-services/reports/week-3.html"
+
+# Listing with one dry 2025 report, so processing it fetches that report page
+LISTING = {
+    "articles": [
+        {"categoryId": "dry", "newsTitle": "Dry Report Week 3", "date": "17 Jan 2025", "link": REPORT_URL}
+    ],
+    "hasMore": False,
+}
+
+def _response(status_code, content=b"", headers=None):
+    """Build a requests.Response as the session would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+class ListingCacheTests(unittest.TestCase):
+    """Conditional fetches of the weekly reports listing."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.client = BalticExchangeAPIClient(delay_between_requests=0, cache_dir=self._tmp.name)
+        self.body_file, self.meta_file = self.client._listing_cache_files()
+
+    def _write_listing_cache(self, listing):
+        self.body_file.write_bytes(orjson.dumps(listing))
+        self.meta_file.write_bytes(orjson.dumps({"etag": '"v1"', "last_modified": None}))
+
+    def test_not_modified_is_skipped_when_requested(self):
+        self._write_listing_cache(LISTING)
+        with mock.patch.object(self.client.session, "get", return_value=_response(304)) as get:
+            result = self.client.get_weekly_roundup_data(skip_if_unchanged=True)
+
+        self.assertEqual(result["status"], "not_modified")
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"v1"')
+        # Nothing beyond the listing is fetched
+        self.assertEqual(get.call_count, 1)
+
+    def test_not_modified_reprocesses_cached_listing(self):
+        cached_listing = {"articles": [{"categoryId": "wet", "newsTitle": "Tanker Report"}], "hasMore": True}
+        self._write_listing_cache(cached_listing)
+        with mock.patch.object(self.client.session, "get", return_value=_response(304)):
+            result = self.client.get_weekly_roundup_data()
+
+        self.assertEqual(result["method"], "json_api")
+        self.assertEqual(result["raw_content"]["total_articles"], 1)
+        self.assertTrue(result["raw_content"]["has_more"])
+
+    def test_listing_not_cached_when_reports_fail(self):
+        def get(url, **kwargs):
+            if url == REPORT_URL:
+                return _response(500)
+            return _response(200, orjson.dumps(LISTING), {"ETag": '"v1"'})
+
+        with mock.patch.object(self.client.session, "get", side_effect=get):
+            result = self.client.get_weekly_roundup_data(skip_if_unchanged=True)
+
+        self.assertEqual(result["raw_content"]["failed_reports"], 1)
+        self.assertFalse(self.body_file.exists())
+        self.assertFalse(self.meta_file.exists())
+
+    def test_listing_cached_when_reports_succeed(self):
+        def get(url, **kwargs):
+            if url == REPORT_URL:
+                return _response(200, b"<main>Capesize market firmer</main>")
+            return _response(200, orjson.dumps(LISTING), {"ETag": '"v1"'})
+
+        with mock.patch.object(self.client.session, "get", side_effect=get):
+            result = self.client.get_weekly_roundup_data(skip_if_unchanged=True)
+
+        self.assertEqual(result["raw_content"]["failed_reports"], 0)
+        self.assertEqual(orjson.loads(self.body_file.read_bytes()), LISTING)
+        self.assertEqual(orjson.loads(self.meta_file.read_bytes())["etag"], '"v1"')
+
+class ReportCacheTests(unittest.TestCase):
+    """Reuse and revalidation of fetched report text."""
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.client = BalticExchangeAPIClient(delay_between_requests=0, cache_dir=self._tmp.name,
+                                              report_cache_ttl=3600)
+        self.cache_file = self.client._report_cache_file(REPORT_URL)
+        self.cache_file.parent.mkdir(parents=True)
+        self.cache_file.write_text("Capesize market firmer", encoding="utf-8")
+        self.client._report_meta_file(self.cache_file).write_bytes(
+            orjson.dumps({"etag": '"r1"', "last_modified": None})
+        )
+
+    def _age_cache(self, seconds):
+        stale_time = time.time() - seconds
+        os.utime(self.cache_file, (stale_time, stale_time))
+        return stale_time
+
+    def test_fresh_report_is_not_fetched(self):
+        with mock.patch.object(self.client.session, "get") as get:
+            content = self.client._fetch_report_content(REPORT_URL)
+
+        self.assertEqual(content, "Capesize market firmer")
+        get.assert_not_called()
+
+    def test_stale_report_is_revalidated(self):
+        stale_time = self._age_cache(7200)
+        with mock.patch.object(self.client.session, "get", return_value=_response(304)) as get:
+            content = self.client._fetch_report_content(REPORT_URL)
+
+        self.assertEqual(content, "Capesize market firmer")
+        self.assertEqual(get.call_args.kwargs["headers"]["If-None-Match"], '"r1"')
+        # The server confirmed the text, so its TTL starts over
+        self.assertGreater(Path(self.cache_file).stat().st_mtime, stale_time + 3600)
+
+if __name__ == "__main__":
+    unittest.main()
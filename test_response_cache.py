@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Offline tests for the dashboard API's in-process response cache
+(the cache_static_responses middleware in src/main.py).
+"""
+
+import logging
+import unittest
+from unittest import mock
+
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+from src import main
+
+logging.disable(logging.CRITICAL)
+
+ORIGIN = {"Origin": "http://localhost:3000"}
+
+def _failing_health(content):
+    """Stand-in for the health endpoint's response when the service is unhealthy."""
+    return ORJSONResponse(content={"status": "unhealthy"}, status_code=503)
+
+class ResponseCacheTests(unittest.TestCase):
+    """Caching, stale fallback and CORS headers of cached endpoints."""
+
+    def setUp(self):
+        main._response_cache.clear()
+        self.addCleanup(main._response_cache.clear)
+        self.client = TestClient(main.app)
+
+    def _age_cache(self, path, seconds):
+        """Pretend the cached entry for path was stored the given number of seconds earlier."""
+        stored_at, body, raw_headers = main._response_cache[path]
+        main._response_cache[path] = (stored_at - seconds, body, raw_headers)
+
+    def test_health_served_from_cache_within_ttl(self):
+        first = self.client.get("/api/health", headers=ORIGIN)
+        with mock.patch.object(main, "ORJSONResponse", side_effect=AssertionError("handler called")):
+            second = self.client.get("/api/health", headers=ORIGIN)
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, first.content)
+        self.assertEqual(second.headers["content-type"], "application/json")
+        self.assertEqual(second.headers["access-control-allow-origin"], "*")
+
+    def test_health_serves_stale_body_on_error_status(self):
+        ttl, max_stale = main._RESPONSE_CACHE_TTL["/api/health"]
+        cached = self.client.get("/api/health", headers=ORIGIN)
+        self._age_cache("/api/health", ttl + 1)
+
+        with mock.patch.object(main, "ORJSONResponse", _failing_health):
+            response = self.client.get("/api/health", headers=ORIGIN)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, cached.content)
+        self.assertEqual(response.headers["access-control-allow-origin"], "*")
+
+    def test_health_stops_serving_stale_body_after_limit(self):
+        ttl, max_stale = main._RESPONSE_CACHE_TTL["/api/health"]
+        self.client.get("/api/health")
+        self._age_cache("/api/health", ttl + max_stale + 1)
+
+        with mock.patch.object(main, "ORJSONResponse", _failing_health):
+            response = self.client.get("/api/health")
+
+        self.assertEqual(response.status_code, 503)
+
+    def test_connection_check_never_serves_stale_body(self):
+        ttl, max_stale = main._RESPONSE_CACHE_TTL["/api/test-connection"]
+        with mock.patch.object(main.scraper, "test_connection", return_value={"status": "success"}):
+            cached = self.client.get("/api/test-connection", headers=ORIGIN)
+            # Within the TTL the cached result is reused
+            self.assertEqual(self.client.get("/api/test-connection").content, cached.content)
+        self._age_cache("/api/test-connection", ttl + 1)
+
+        with mock.patch.object(main.scraper, "test_connection", side_effect=RuntimeError("upstream down")):
+            response = self.client.get("/api/test-connection", headers=ORIGIN)
+
+        self.assertEqual(response.status_code, 500)
+        self.assertEqual(response.headers["access-control-allow-origin"], "*")
+
+if __name__ == "__main__":
+    unittest.main()